@@ -1,5 +1,5 @@
 import sys
-from data.execution_time_gathering import run_single_source_experiment, run_all_pairs_experiment
+from data.experiment_runner import run_grid, tables
 
 import matplotlib.pyplot as plt
 
@@ -108,26 +108,37 @@ def plot_results(single_source_data, all_pairs_data):
     plt.show()
 
 
-def run_experiments(min_size=10, max_size=100, step=10, samples=5):
+def run_experiments(min_size=10, max_size=100, step=10, samples=5, processes=None, cache_path=None, time_budget=60):
     """
     Run both single source and all pairs experiments.
     
+    Cells of the (algorithm, size, sample) grid run on a process pool and, when
+    cache_path is given, are stored there as they finish so an interrupted or
+    extended sweep only computes the missing cells.
+    
     Args:
         min_size: Minimum graph size
         max_size: Maximum graph size
         step: Size increment
         samples: Number of samples per size
+        processes: Worker processes (default: one per CPU)
+        cache_path: JSON-lines file of finished cells, or None to keep results in memory
+        time_budget: Skip cells predicted to take longer than this many seconds (None disables);
+                     predictive only, a cell that has started is never interrupted
     
     Returns:
-        Tuple of (single_source_data, all_pairs_data)
+        Tuple of (single_source_data, all_pairs_data); skipped cells are nan
     """
+    sizes = range(min_size, max_size + 1, step)
+
     print(f"Running single source experiment (size {min_size} to {max_size}, step {step}, {samples} samples per size)...")
-    single_source_data = run_single_source_experiment(min_size, max_size, step, samples)
-    
-    # Use smaller sizes for all-pairs experiment as it's much slower
-    all_pairs_max = min(max_size, 50)  # Limit to 50 for all-pairs to avoid long wait
-    print(f"Running all pairs experiment (size {min_size} to {all_pairs_max}, step {step}, {samples} samples per size)...")
-    all_pairs_data = run_all_pairs_experiment(min_size, all_pairs_max, step, samples)
+    cache = run_grid("single_source", sizes, samples, processes, cache_path, time_budget)
+    single_source_data = tables(cache, "single_source", sizes)
+
+    # The time budget, rather than a fixed size cap, keeps the slow all-pairs cells in check
+    print(f"Running all pairs experiment (size {min_size} to {max_size}, step {step}, {samples} samples per size)...")
+    cache = run_grid("all_pairs", sizes, samples, processes, cache_path, time_budget)
+    all_pairs_data = tables(cache, "all_pairs", sizes)
     
     return single_source_data, all_pairs_data
 
@@ -150,7 +161,8 @@ if __name__ == "__main__":
         samples = int(sys.argv[4])
     
     # Run experiments
-    single_source_data, all_pairs_data = run_experiments(min_size, max_size, step, samples)
+    single_source_data, all_pairs_data = run_experiments(min_size, max_size, step, samples,
+                                                         cache_path="experiment_cache.jsonl")
 
     # Print and plot results
     print_results(single_source_data, "single_source")
@@ -0,0 +1,314 @@
+import argparse
+import json
+import math
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from data.data_generator import get_large_random_graph, get_random_graph
+from shortest_path.algorithms import bellman_ford, dijkstra, floyd_warshall, spfa
+from shortest_path.all_pairs import blocked_floyd_warshall, johnson
+from shortest_path.bidirectional import bidirectional_dijkstra
+from shortest_path.delta_stepping import PARALLEL_MIN_FRONTIER, delta_stepping
+from shortest_path.dynamic import DynamicAllPairs, DynamicSingleSource
+from shortest_path.oracle import DistanceOracle, symmetrize
+from shortest_path.stats import Stats
+
+# Every case runs on (graph, start, goal) from get_random_graph
+CASES = {
+    "dijkstra": lambda graph, start, goal: dijkstra(graph, start, goal),
+    "bidirectional_dijkstra": lambda graph, start, goal: bidirectional_dijkstra(graph, start, goal),
+    "delta_stepping": lambda graph, start, goal: delta_stepping(graph, start, goal),
+    "delta_stepping_parallel": lambda graph, start, goal: delta_stepping(graph, start, goal, processes=2),
+    "bellman_ford": lambda graph, start, goal: bellman_ford(graph, start, goal),
+    "spfa": lambda graph, start, goal: spfa(graph, start, goal),
+    "floyd_warshall": lambda graph, start, goal: floyd_warshall(graph, start, goal),
+    "blocked_floyd_warshall": lambda graph, start, goal: blocked_floyd_warshall(graph),
+    "johnson": lambda graph, start, goal: johnson(graph),
+}
+
+# Cases skipped below this graph size. A smaller graph never has a frontier large
+# enough to be handed to the pool, so the parallel case would only time starting it.
+MIN_SIZES = {
+    "delta_stepping_parallel": PARALLEL_MIN_FRONTIER,
+}
+
+# Two-sided 95% critical values of Student's t by degrees of freedom
+T_CRITICAL = [(1, 12.706), (2, 4.303), (3, 3.182), (4, 2.776), (5, 2.571), (6, 2.447), (7, 2.365),
+              (8, 2.306), (9, 2.262), (10, 2.228), (12, 2.179), (15, 2.131), (20, 2.086),
+              (30, 2.042), (60, 2.000), (120, 1.980)]
+
+
+def measure(function, *args):
+    # Times one call without tracemalloc, then repeats it under tracemalloc for the peak
+    t_start = time.perf_counter()
+    result = function(*args)
+    elapsed = time.perf_counter() - t_start
+
+    return result, elapsed, measure_peak_memory(function, *args)
+
+
+def measure_times(function, *args, warmup=1, repeat=5):
+    for _ in range(warmup):
+        function(*args)
+
+    times = []
+    for _ in range(repeat):
+        t_start = time.perf_counter()
+        function(*args)
+        times.append(time.perf_counter() - t_start)
+    return times
+
+
+def measure_peak_memory(function, *args):
+    tracemalloc.start()
+    try:
+        function(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def count_operations(function, *args):
+    # Runs the call once more with a Stats attached; kept out of the timed runs
+    stats = Stats()
+    function(*args, stats=stats)
+    return stats
+
+
+def run_benchmark(cases=None, sizes=(10, 20, 30), samples=3, warmup=1, repeat=5, seed=0):
+    cases = cases or list(CASES)
+    results = []
+
+    for size in sizes:
+        graphs = []
+        for sample in range(samples):
+            # Inputs depend only on (seed, size, sample), so two runs see the same graphs
+            random.seed(f"{seed}-{size}-{sample}")
+            graphs.append(get_random_graph(size, ensure_path=True)[:3])
+
+        for name in cases:
+            if size < MIN_SIZES.get(name, 0):
+                continue
+            times, memory = [], []
+            for graph, start, goal in graphs:
+                times.extend(measure_times(CASES[name], graph, start, goal, warmup=warmup, repeat=repeat))
+                memory.append(measure_peak_memory(CASES[name], graph, start, goal))
+            results.append({"case": name, "size": size, "times": times, "peak_memory": memory})
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "seed": seed,
+            "samples": samples,
+            "warmup": warmup,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def run_update_benchmark(sizes=(20, 40, 80), updates=50, seed=0):
+    # Updates per second of the dynamic structures against recomputing from scratch
+    # after every update, on the same random sequence of weight changes and deletions
+    results = []
+    for size in sizes:
+        random.seed(f"{seed}-{size}-updates")
+        graph, start, _, _ = get_random_graph(size, ensure_path=True)
+        sequence = []
+        for _ in range(updates):
+            u, v = random.sample(range(size), 2)
+            sequence.append((u, v, float('inf') if random.random() < 0.15 else random.randint(1, 100)))
+
+        row = {"size": size, "updates": updates}
+        for name, build, recompute in (
+                ("all_pairs", lambda: DynamicAllPairs(graph), floyd_warshall),
+                ("single_source", lambda: DynamicSingleSource(graph, start),
+                 lambda g: dijkstra(g, start, queue='heap'))):
+            dynamic = build()
+            t_start = time.perf_counter()
+            for u, v, weight in sequence:
+                dynamic.update_edge(u, v, weight)
+            incremental = time.perf_counter() - t_start
+
+            # Replay the sequence on a plain adjacency copy, recomputing after every update;
+            # parallel edges collapse to the lightest, as in the dynamic structures
+            edges = [{} for _ in range(size)]
+            for u in range(size):
+                for v, weight in graph[u]:
+                    edges[u][v] = min(weight, edges[u].get(v, weight))
+            full = 0.0
+            for u, v, weight in sequence:
+                if weight == float('inf'):
+                    edges[u].pop(v, None)
+                else:
+                    edges[u][v] = weight
+                current = [list(targets.items()) for targets in edges]
+                t_start = time.perf_counter()
+                recompute(current)
+                full += time.perf_counter() - t_start
+
+            row[name] = {"incremental_per_second": updates / incremental if incremental else float('inf'),
+                         "recompute_per_second": updates / full if full else float('inf')}
+        results.append(row)
+    return results
+
+
+def run_oracle_benchmark(sizes=(1000, 5000), ks=(2, 3), sources=10, targets=20, seed=0):
+    # Build time, stored entries, query latency and observed stretch of the distance
+    # oracle against exact dijkstra on the same (symmetrized) graph
+    results = []
+    for size in sizes:
+        graph = get_large_random_graph(size, seed=seed)[0]
+        undirected = symmetrize(graph)
+        rng = random.Random(f"{seed}-{size}-oracle")
+        exact = {}
+        for source in rng.sample(range(size), min(sources, size)):
+            distances = dijkstra(undirected, source, queue='heap')
+            exact[source] = {target: distances[target] for target in rng.sample(range(size), min(targets, size))}
+
+        for k in ks:
+            t_start = time.perf_counter()
+            oracle = DistanceOracle.build(graph, k=k, seed=seed)
+            build_time = time.perf_counter() - t_start
+
+            pairs = [(u, v) for u, row in exact.items() for v in row]
+            t_start = time.perf_counter()
+            answers = [oracle.query(u, v) for u, v in pairs]
+            query_time = (time.perf_counter() - t_start) / len(pairs)
+
+            stretches = [answer / exact[u][v] for (u, v), answer in zip(pairs, answers)
+                         if 0 < exact[u][v] < float('inf')]
+            results.append({
+                "size": size,
+                "k": k,
+                "build_seconds": build_time,
+                "entries": oracle.size,
+                "entries_per_node": oracle.size / size,
+                "query_seconds": query_time,
+                "max_stretch": max(stretches, default=1.0),
+                "mean_stretch": statistics.mean(stretches) if stretches else 1.0,
+                "stretch_bound": oracle.stretch,
+            })
+    return results
+
+
+def compare(baseline, current, min_change=0.05):
+    # Welch's t-test per (case, size); a regression is a significant slowdown above min_change
+    before = {(r["case"], r["size"]): r["times"] for r in baseline["results"]}
+    report = []
+
+    for r in current["results"]:
+        key = (r["case"], r["size"])
+        if key not in before:
+            continue
+        old, new = before[key], r["times"]
+        change = statistics.mean(new) / statistics.mean(old) - 1 if statistics.mean(old) else 0.0
+        significant = _welch_significant(old, new)
+        report.append({
+            "case": r["case"],
+            "size": r["size"],
+            "baseline_mean": statistics.mean(old),
+            "current_mean": statistics.mean(new),
+            "change": change,
+            "significant": significant,
+            "regression": significant and change > min_change,
+        })
+
+    return report
+
+
+def _welch_significant(a, b):
+    if len(a) < 2 or len(b) < 2:
+        return False
+    va, vb = statistics.variance(a) / len(a), statistics.variance(b) / len(b)
+    if va + vb == 0:
+        return statistics.mean(a) != statistics.mean(b)
+
+    t = abs(statistics.mean(a) - statistics.mean(b)) / math.sqrt(va + vb)
+    df = (va + vb) ** 2 / (va ** 2 / (len(a) - 1) + vb ** 2 / (len(b) - 1))
+    return t > _t_critical(df)
+
+
+def _t_critical(df):
+    if df > T_CRITICAL[-1][0]:
+        return 1.960
+    # Largest tabulated df not above the actual one, which errs on the conservative side
+    critical = T_CRITICAL[0][1]
+    for degrees, value in T_CRITICAL:
+        if degrees <= df:
+            critical = value
+    return critical
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the shortest path algorithms.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run the benchmark and write JSON results")
+    run.add_argument("--cases", nargs="+", choices=sorted(CASES))
+    run.add_argument("--sizes", nargs="+", type=int, default=[10, 20, 30])
+    run.add_argument("--samples", type=int, default=3)
+    run.add_argument("--warmup", type=int, default=1)
+    run.add_argument("--repeat", type=int, default=5)
+    run.add_argument("--seed", type=int, default=0)
+    run.add_argument("--out", default="-", help="output file, '-' for stdout")
+
+    updates = commands.add_parser("updates", help="update throughput of the dynamic structures")
+    updates.add_argument("--sizes", nargs="+", type=int, default=[20, 40, 80])
+    updates.add_argument("--updates", type=int, default=50)
+    updates.add_argument("--seed", type=int, default=0)
+
+    oracle = commands.add_parser("oracle", help="build and query the approximate distance oracle")
+    oracle.add_argument("--sizes", nargs="+", type=int, default=[1000, 5000])
+    oracle.add_argument("-k", nargs="+", type=int, default=[2, 3])
+    oracle.add_argument("--seed", type=int, default=0)
+
+    diff = commands.add_parser("compare", help="flag regressions between two result files")
+    diff.add_argument("baseline")
+    diff.add_argument("current")
+    diff.add_argument("--min-change", type=float, default=0.05)
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        results = run_benchmark(args.cases, args.sizes, args.samples, args.warmup, args.repeat, args.seed)
+        text = json.dumps(results, indent=2)
+        if args.out == "-":
+            print(text)
+        else:
+            with open(args.out, "w") as f:
+                f.write(text)
+        return 0
+
+    if args.command == "updates":
+        for row in run_update_benchmark(args.sizes, args.updates, args.seed):
+            for name in ("all_pairs", "single_source"):
+                print("{:<14} {:>6} {:>14.1f} updates/s incremental {:>14.1f} updates/s recompute".format(
+                    name, row["size"], row[name]["incremental_per_second"], row[name]["recompute_per_second"]))
+        return 0
+
+    if args.command == "oracle":
+        for row in run_oracle_benchmark(args.sizes, args.k, seed=args.seed):
+            print("n={size:<8} k={k} build {build_seconds:8.3f}s  {entries_per_node:8.1f} entries/node  "
+                  "query {query_seconds:.2e}s  stretch max {max_stretch:.3f} mean {mean_stretch:.3f} "
+                  "(bound {stretch_bound})".format(**row))
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+    report = compare(baseline, current, args.min_change)
+    for row in report:
+        flag = "REGRESSION" if row["regression"] else ("significant" if row["significant"] else "")
+        print("{:<24} {:>6} {:>12.6f} {:>12.6f} {:>+8.1%} {}".format(
+            row["case"], row["size"], row["baseline_mean"], row["current_mean"], row["change"], flag))
+    return 1 if any(row["regression"] for row in report) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,9 @@
+import math
 import random
+from array import array
 from collections import deque
+from itertools import accumulate
+from shortest_path.graph import CSRGraph, index_typecode
 
 def get_random_graph(size, limit=100, ensure_path=True):
 
@@ -78,11 +82,15 @@ def add_path(graph, start, end, limit):
             graph[u].append((v, weight))
 
 
-def has_path(graph, start, goal):
+def has_path(graph, start, goal, reachability=None):
 
     if start == goal:
         return True
 
+    # A prebuilt shortest_path.reachability.ReachabilityIndex answers without a BFS
+    if reachability is not None:
+        return reachability.reachable(start, goal)
+
     visited = set()
     queue = deque([start])
 
@@ -100,3 +108,102 @@ def has_path(graph, start, goal):
                 queue.append(neighbor)
 
     return False
+
+
+def get_large_random_graph(size, average_degree=4, density=None, family="uniform", limit=100, seed=None):
+
+    # Builds the CSR buffers directly, node by node, with O(size * average_degree) work.
+    # Families: "uniform" (random targets), "grid" (road-like 4-neighbour lattice) and
+    # "power_law" (heavy-tailed degrees, popular targets). Same return shape as get_random_graph.
+    if size == 0:
+        return [CSRGraph(array('q', [0]), array('b'), array('q')), -1, -1, 0]
+    if density is not None:
+        average_degree = density * (size - 1)
+
+    rng = random.Random(seed)
+    start = rng.randrange(size)
+    goal = rng.randrange(size)
+    while start == goal and size > 1:
+        goal = rng.randrange(size)
+
+    if family == "grid":
+        neighbors = _grid_neighbors(size)
+        forced = {}
+    elif family in ("uniform", "power_law"):
+        neighbors = _random_neighbors(size, average_degree, family == "power_law", rng)
+        forced = _forced_path(size, start, goal, rng)
+    else:
+        raise ValueError(f"Unknown graph family: {family}")
+
+    offsets = array('q', [0]) * (size + 1)
+    targets = array(index_typecode(size))
+    weights = array('q')
+    for u in range(size):
+        node_targets = neighbors(u)
+        if u in forced and forced[u] not in node_targets:
+            node_targets.append(forced[u])
+        targets.extend(node_targets)
+        weights.extend(rng.randint(1, limit) for _ in node_targets)
+        offsets[u + 1] = len(targets)
+
+    return [CSRGraph(offsets, targets, weights), start, goal, len(targets)]
+
+
+def _random_neighbors(size, average_degree, power_law, rng):
+
+    nodes = range(size)
+    cumulative = None
+    if power_law:
+        # Zipf-like popularity over a random permutation of the nodes
+        popularity = [1 / (rank + 1) for rank in range(size)]
+        nodes = list(nodes)
+        rng.shuffle(nodes)
+        cumulative = list(accumulate(popularity))
+
+    def neighbors(u):
+        if power_law:
+            # Pareto(2) has mean 2, so the expected out-degree is average_degree
+            degree = int(rng.paretovariate(2.0) * average_degree / 2)
+        else:
+            degree = rng.randint(0, max(1, round(2 * average_degree)))
+        degree = min(degree, size - 1)
+        chosen = set(rng.choices(nodes, cum_weights=cumulative, k=degree))
+        chosen.discard(u)
+        return list(chosen)
+
+    return neighbors
+
+
+def _grid_neighbors(size):
+
+    width = math.isqrt(size - 1) + 1
+
+    def neighbors(u):
+        row, col = divmod(u, width)
+        result = []
+        if col > 0:
+            result.append(u - 1)
+        if col < width - 1 and u + 1 < size:
+            result.append(u + 1)
+        if row > 0:
+            result.append(u - width)
+        if u + width < size:
+            result.append(u + width)
+        return result
+
+    return neighbors
+
+
+def _forced_path(size, start, goal, rng):
+
+    # Chain start -> a few random intermediates -> goal, so a path exists without a BFS
+    if start == goal:
+        return {}
+    path = [start]
+    while len(path) < min(4, size - 1):
+        node = rng.randrange(size)
+        if node not in path and node != goal:
+            path.append(node)
+    path.append(goal)
+    return dict(zip(path, path[1:]))
+
@@ -1,43 +1,30 @@
-import time
-import tracemalloc
+from data.benchmark import count_operations, measure
 from data.data_generator import get_random_graph
 from shortest_path.algorithms import dijkstra, bellman_ford, floyd_warshall
 
-def run_single_source_experiment(min_size=10, max_size=100, step=10, samples=5):
+def run_single_source_experiment(min_size=10, max_size=100, step=10, samples=5, counters=False):
 
+    # counters=True appends to each row a dict of median operation counters per algorithm,
+    # collected in an extra instrumented run so the timings are unaffected
     results = []
     for size in range(min_size, max_size + 1, step):
         print(f"Testing size (single source): {size}")
         d_times, bf_times, fw_times = [], [], []
         d_mems, bf_mems, fw_mems = [], [], []
+        d_counts, bf_counts, fw_counts = [], [], []
 
         for _ in range(samples):
             graph_data = get_random_graph(size, ensure_path=True)
             graph, start, goal, _ = graph_data
 
             # Dijkstra's algorithm
-            tracemalloc.start()
-            t_start = time.perf_counter()
-            d_dist = dijkstra(graph, start, goal)
-            d_time = time.perf_counter() - t_start
-            d_mem = tracemalloc.get_traced_memory()[1]
-            tracemalloc.stop()
+            d_dist, d_time, d_mem = measure(dijkstra, graph, start, goal)
 
             # Bellman-Ford algorithm
-            tracemalloc.start()
-            t_start = time.perf_counter()
-            bf_dist = bellman_ford(graph, start, goal)
-            bf_time = time.perf_counter() - t_start
-            bf_mem = tracemalloc.get_traced_memory()[1]
-            tracemalloc.stop()
+            bf_dist, bf_time, bf_mem = measure(bellman_ford, graph, start, goal)
 
             # Floyd-Warshall algorithm
-            tracemalloc.start()
-            t_start = time.perf_counter()
-            fw_dist = floyd_warshall(graph, start, goal)
-            fw_time = time.perf_counter() - t_start
-            fw_mem = tracemalloc.get_traced_memory()[1]
-            tracemalloc.stop()
+            fw_dist, fw_time, fw_mem = measure(floyd_warshall, graph, start, goal)
 
 
             assert d_dist == bf_dist == fw_dist, "Discrepancy in distances!"
@@ -49,7 +36,12 @@ def run_single_source_experiment(min_size=10, max_size=100, step=10, samples=5):
             bf_mems.append(bf_mem)
             fw_mems.append(fw_mem)
 
-        results.append([
+            if counters:
+                d_counts.append(count_operations(dijkstra, graph, start, goal).counters)
+                bf_counts.append(count_operations(bellman_ford, graph, start, goal).counters)
+                fw_counts.append(count_operations(floyd_warshall, graph, start, goal).counters)
+
+        row = [
             size,
             sorted(d_times)[len(d_times) // 2],
             sorted(bf_times)[len(bf_times) // 2],
@@ -57,7 +49,14 @@ def run_single_source_experiment(min_size=10, max_size=100, step=10, samples=5):
             sorted(d_mems)[len(d_mems) // 2],
             sorted(bf_mems)[len(bf_mems) // 2],
             sorted(fw_mems)[len(fw_mems) // 2],
-        ])
+        ]
+        if counters:
+            row.append({
+                "dijkstra": _median_counters(d_counts),
+                "bellman_ford": _median_counters(bf_counts),
+                "floyd_warshall": _median_counters(fw_counts),
+            })
+        results.append(row)
     return results
 
 
@@ -73,32 +72,15 @@ def run_all_pairs_experiment(min_size=10, max_size=50, step=10, samples=3):
             graph = get_random_graph(size, ensure_path=True)[0]
 
             # Floyd-Warshall (naturally calculates all pairs)
-            tracemalloc.start()
-            t_start = time.perf_counter()
-            fw_matrix = floyd_warshall(graph)  # No start/end to get full matrix
-            fw_time = time.perf_counter() - t_start
-            fw_mem = tracemalloc.get_traced_memory()[1]
-            tracemalloc.stop()
+            fw_matrix, fw_time, fw_mem = measure(floyd_warshall, graph)  # No start/end to get full matrix
 
             # Calculate all pairs with Dijkstra by running it from each node
-            tracemalloc.start()
-            t_start = time.perf_counter()
-            d_result = []
-            for start in range(size):
-                d_result.append(dijkstra(graph, start))  # Get all distances from start
-            d_all_time = time.perf_counter() - t_start
-            d_all_mem = tracemalloc.get_traced_memory()[1]
-            tracemalloc.stop()
+            d_result, d_all_time, d_all_mem = measure(
+                lambda: [dijkstra(graph, start) for start in range(size)])  # Get all distances from each start
 
             # Calculate all pairs with Bellman-Ford by running it from each node
-            tracemalloc.start()
-            t_start = time.perf_counter()
-            bf_result = []
-            for start in range(size):
-                bf_result.append(bellman_ford(graph, start))  # Get all distances from start
-            bf_all_time = time.perf_counter() - t_start
-            bf_all_mem = tracemalloc.get_traced_memory()[1]
-            tracemalloc.stop()
+            bf_result, bf_all_time, bf_all_mem = measure(
+                lambda: [bellman_ford(graph, start) for start in range(size)])  # Get all distances from each start
 
             # Verify some random pairs to ensure consistency
             for _ in range(5):  # Check 5 random pairs
@@ -132,3 +114,7 @@ def run_all_pairs_experiment(min_size=10, max_size=50, step=10, samples=3):
             sorted(bf_all_mems)[len(bf_all_mems) // 2],
         ])
     return results
+
+
+def _median_counters(samples):
+    return {name: sorted(sample[name] for sample in samples)[len(samples) // 2] for name in samples[0]}
@@ -0,0 +1,166 @@
+import hashlib
+import json
+import math
+import os
+import random
+import statistics
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from data.benchmark import measure
+from data.data_generator import get_random_graph
+from shortest_path.algorithms import bellman_ford, dijkstra, floyd_warshall
+
+# Column order matches the tables printed and plotted by app.py
+EXPERIMENTS = {
+    "single_source": ("dijkstra", "bellman_ford", "floyd_warshall"),
+    "all_pairs": ("floyd_warshall", "dijkstra", "bellman_ford"),
+}
+
+SINGLE_SOURCE = {
+    "dijkstra": lambda graph, start, goal: dijkstra(graph, start, goal),
+    "bellman_ford": lambda graph, start, goal: bellman_ford(graph, start, goal),
+    "floyd_warshall": lambda graph, start, goal: floyd_warshall(graph, start, goal),
+}
+
+ALL_PAIRS = {
+    "floyd_warshall": lambda graph: floyd_warshall(graph),
+    "dijkstra": lambda graph: [dijkstra(graph, start) for start in range(len(graph))],
+    "bellman_ford": lambda graph: [bellman_ford(graph, start) for start in range(len(graph))],
+}
+
+# Growth exponent assumed when only one smaller size has been measured
+DEFAULT_EXPONENT = 3
+
+
+def run_cell(cell):
+    # One (experiment, algorithm, size, sample) measurement. The graph depends only on
+    # (experiment, size, sample), so every algorithm of a sample sees the same input.
+    experiment, algorithm, size, sample = cell
+    random.seed(f"{experiment}-{size}-{sample}")
+    graph, start, goal, _ = get_random_graph(size, ensure_path=True)
+
+    if experiment == "single_source":
+        result, elapsed, memory = measure(SINGLE_SOURCE[algorithm], graph, start, goal)
+    else:
+        result, elapsed, memory = measure(ALL_PAIRS[algorithm], graph)
+
+    return {"experiment": experiment, "algorithm": algorithm, "size": size, "sample": sample,
+            "time": elapsed, "memory": memory, "result": _digest(result)}
+
+
+def run_grid(experiment, sizes, samples, processes=None, cache_path=None, time_budget=None, log=print):
+    # Runs every missing cell of the grid on a process pool. Finished cells are appended
+    # to cache_path as JSON lines right away, so an interrupted sweep resumes where it
+    # stopped. Sizes run in increasing order so that a cell whose predicted time exceeds
+    # time_budget (seconds) can be skipped instead of blocking the run. The budget is
+    # predictive only: a cell that was started always runs to completion, however long
+    # it takes, and the first size of an algorithm is never skipped.
+    cache = load_cache(cache_path)
+
+    with ProcessPoolExecutor(processes) as pool:
+        for size in sorted(sizes):
+            cells = []
+            for algorithm in EXPERIMENTS[experiment]:
+                if time_budget is not None:
+                    predicted = predict_time(cache, experiment, algorithm, size)
+                    if predicted > time_budget:
+                        log(f"Skipping {experiment} {algorithm} at size {size}: "
+                            f"predicted {predicted:.1f}s per sample exceeds the {time_budget}s budget")
+                        continue
+                cells.extend((experiment, algorithm, size, sample) for sample in range(samples)
+                             if _key(experiment, algorithm, size, sample) not in cache)
+
+            if cells:
+                log(f"Testing size ({experiment.replace('_', ' ')}): {size}, {len(cells)} cells")
+            for future in as_completed([pool.submit(run_cell, cell) for cell in cells]):
+                record = future.result()
+                cache[_key(record["experiment"], record["algorithm"], record["size"], record["sample"])] = record
+                _append(cache_path, record)
+
+    return cache
+
+
+def predict_time(cache, experiment, algorithm, size):
+    # Extrapolates median times at smaller sizes with a power law fitted to the last two
+    points = {}
+    for record in cache.values():
+        if record["experiment"] == experiment and record["algorithm"] == algorithm and record["size"] < size:
+            points.setdefault(record["size"], []).append(record["time"])
+    if not points:
+        return 0.0
+
+    measured = sorted((s, statistics.median(times)) for s, times in points.items())
+    last_size, last_time = measured[-1]
+    exponent = DEFAULT_EXPONENT
+    if len(measured) >= 2:
+        previous_size, previous_time = measured[-2]
+        if previous_time > 0 and last_time > 0:
+            exponent = min(4.0, max(1.0, math.log(last_time / previous_time) / math.log(last_size / previous_size)))
+    return last_time * (size / last_size) ** exponent
+
+
+def tables(cache, experiment, sizes):
+    # Rows of [size, median time per algorithm..., median memory per algorithm...];
+    # cells that were skipped or never run show up as nan. Raises AssertionError when
+    # the algorithms disagree on the result of a sample.
+    algorithms = EXPERIMENTS[experiment]
+    rows = []
+    for size in sorted(sizes):
+        check_agreement(cache, experiment, size)
+        times, memory = [], []
+        for algorithm in algorithms:
+            records = [r for r in cache.values()
+                       if r["experiment"] == experiment and r["algorithm"] == algorithm and r["size"] == size]
+            times.append(statistics.median(r["time"] for r in records) if records else float('nan'))
+            memory.append(statistics.median(r["memory"] for r in records) if records else float('nan'))
+        rows.append([size] + times + memory)
+    return rows
+
+
+def check_agreement(cache, experiment, size):
+    # Every algorithm solved the same graph for a given sample, so their result digests
+    # must match; records cached before digests were kept are ignored
+    results = {}
+    for r in cache.values():
+        if r["experiment"] == experiment and r["size"] == size and r.get("result") is not None:
+            results.setdefault(r["sample"], {})[r["algorithm"]] = r["result"]
+    for sample, by_algorithm in sorted(results.items()):
+        if len(set(by_algorithm.values())) > 1:
+            raise AssertionError(f"Discrepancy in distances for {experiment} size {size} "
+                                 f"sample {sample}: {by_algorithm}")
+
+
+def load_cache(cache_path):
+    cache = {}
+    if cache_path is None or not os.path.exists(cache_path):
+        return cache
+    with open(cache_path) as f:
+        for line in f:
+            # A run killed mid-write can leave a truncated last line
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            cache[_key(record["experiment"], record["algorithm"], record["size"], record["sample"])] = record
+    return cache
+
+
+def _append(cache_path, record):
+    if cache_path is None:
+        return
+    with open(cache_path, "a") as f:
+        f.write(json.dumps(record) + "\n")
+
+
+def _digest(result):
+    # A single distance is kept as is; a distance matrix is reduced to a hash. Values
+    # go through float() so that 3 from one algorithm and 3.0 from another agree.
+    if not isinstance(result, list):
+        return float(result)
+    digest = hashlib.sha256()
+    for row in result:
+        digest.update(" ".join(repr(float(d)) for d in row).encode() + b"\n")
+    return digest.hexdigest()
+
+
+def _key(experiment, algorithm, size, sample):
+    return f"{experiment}|{algorithm}|{size}|{sample}"
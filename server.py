@@ -0,0 +1,32 @@
+import argparse
+import asyncio
+from shortest_path.graph_io import read_edge_list
+from shortest_path.service import DEFAULT_CACHE_SIZE, ShortestPathService
+
+
+async def main(args):
+    # Binary graph files are memory-mapped by every worker; text edge lists are parsed once here
+    graph = read_edge_list(args.graph) if args.edge_list else args.graph
+    service = ShortestPathService(graph, args.workers, args.cache_size, args.threads)
+    server = await service.serve(args.host, args.port)
+    print(f"Serving {len(service.graph)} nodes on {args.host}:{args.port}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Answer shortest path queries over a socket, one JSON object per line.")
+    parser.add_argument("graph", help="graph file written by graph_io.save_graph")
+    parser.add_argument("--edge-list", action="store_true", help="read the graph as a text edge list instead")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--cache-size", type=int, default=DEFAULT_CACHE_SIZE)
+    parser.add_argument("--threads", action="store_true", help="search on threads instead of processes")
+    try:
+        asyncio.run(main(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
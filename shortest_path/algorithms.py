@@ -1,9 +1,46 @@
 import heapq
+from collections import deque
+from shortest_path.graph import CSRGraph, reverse_adjacency
+from shortest_path.paths import NextHopMatrix, predecessor_array
+from shortest_path.queues import choose_queue, dial_dijkstra, radix_dijkstra
 
 
-def dijkstra(graph, start, end=None):
+class NegativeCycle(str):
+    # Equal to the "Negative cycle detected" message bellman_ford has always returned,
+    # and carries the nodes that lie on or are reachable from the negative cycle
+    def __new__(cls, nodes):
+        cycle = super().__new__(cls, "Negative cycle detected")
+        cycle.nodes = frozenset(nodes)
+        return cycle
 
+
+def dijkstra(graph, start, end=None, queue='auto', predecessors=False, reachability=None, stats=None):
+
+    # queue: 'heap', 'dial' or 'radix'; 'auto' uses a bucket queue on CSR graphs with
+    # non-negative integer weights and the binary heap otherwise, or always the heap
+    # when stats are collected.
+    # predecessors=True also returns the predecessor array: (result, predecessors)
+    # reachability: a ReachabilityIndex used to answer unreachable targets without searching
+    # stats: a Stats collecting heap pushes, stale pops and relaxations (binary heap
+    # only; an explicit 'dial' or 'radix' queue records just the search timing)
     n = len(graph)
+    parents = predecessor_array(n) if predecessors else None
+    if end is not None and reachability is not None and not reachability.reachable(start, end):
+        return _with_predecessors(float('inf'), parents)
+    if queue == 'auto':
+        queue = 'heap' if stats is not None else choose_queue(graph)
+    if queue in ('dial', 'radix'):
+        search = dial_dijkstra if queue == 'dial' else radix_dijkstra
+        if stats is None:
+            return _with_predecessors(search(graph, start, end, parents), parents)
+        with stats.phase('search'):
+            return _with_predecessors(search(graph, start, end, parents), parents)
+    if stats is not None:
+        with stats.phase('search'):
+            return _with_predecessors(_dijkstra_counted(graph, start, end, parents, stats), parents)
+    if isinstance(graph, CSRGraph):
+        return _with_predecessors(_dijkstra_csr(graph, start, end, parents), parents)
+
     distances = [float('inf')] * n
     distances[start] = 0
     heap = [(0, start)]
@@ -13,59 +50,371 @@ def dijkstra(graph, start, end=None):
         
 
         if end is not None and current_node == end:
-            return distances[end]
+            return _with_predecessors(distances[end], parents)
             
         if current_dist > distances[current_node]:
             continue
             
         for neighbor, weight in graph[current_node]:
-            if distances[current_node] + weight < distances[neighbor]:
-                distances[neighbor] = distances[current_node] + weight
-                heapq.heappush(heap, (distances[neighbor], neighbor))
+            new_dist = current_dist + weight
+            if new_dist < distances[neighbor]:
+                distances[neighbor] = new_dist
+                if parents is not None:
+                    parents[neighbor] = current_node
+                heapq.heappush(heap, (new_dist, neighbor))
     
 
-    return distances[end] if end is not None else distances
+    return _with_predecessors(distances[end] if end is not None else distances, parents)
 
 
-def bellman_ford(graph, start, end=None):
+def bellman_ford(graph, start, end=None, predecessors=False, stats=None):
 
+    # predecessors=True returns (result, predecessors) unless a negative cycle is found
+    # stats: a Stats collecting passes and successful relaxations
+    if stats is not None:
+        return _bellman_ford_counted(graph, start, end, predecessors, stats)
+    if isinstance(graph, CSRGraph):
+        return _bellman_ford_csr(graph, start, end, predecessors)
     n = len(graph)
     distances = [float('inf')] * n
     distances[start] = 0
+    parents = predecessor_array(n) if predecessors else None
     
 
     for _ in range(n - 1):
+        changed = False
         for u in range(n):
+            dist_u = distances[u]
+            if dist_u == float('inf'):
+                continue
             for v, weight in graph[u]:
-                if distances[u] != float('inf') and distances[u] + weight < distances[v]:
-                    distances[v] = distances[u] + weight
+                if dist_u + weight < distances[v]:
+                    distances[v] = dist_u + weight
+                    if parents is not None:
+                        parents[v] = u
+                    changed = True
+
+        if not changed:
+            break
     
 
+    # Every node that can still be improved is reachable from a negative cycle
+    improvable = []
     for u in range(n):
         for v, weight in graph[u]:
             if distances[u] != float('inf') and distances[u] + weight < distances[v]:
-                return "Negative cycle detected"
+                improvable.append(v)
+
+    if improvable:
+        return NegativeCycle(_reachable_from(graph, improvable))
+
+    return _with_predecessors(distances[end] if end is not None else distances, parents)
+
+
+def spfa(graph, start, end=None, reachability=None):
+
+    if end is not None and reachability is not None and not reachability.reachable(start, end):
+        return float('inf')
+
+    n = len(graph)
+    distances = [float('inf')] * n
+    distances[start] = 0
+    predecessors = [-1] * n
+    hops = [0] * n
+    in_queue = [False] * n
+    in_queue[start] = True
+    queue = deque([start])
+
+    # With a target, only nodes that can still reach it are worth relaxing
+    relevant = None
+    if end is not None:
+        relevant = [False] * n
+        for node in _reachable_from(reverse_adjacency(graph), [end]):
+            relevant[node] = True
+
+    while queue:
+        u = queue.popleft()
+        in_queue[u] = False
+        dist_u = distances[u]
+
+        for v, weight in graph[u]:
+            if dist_u + weight < distances[v]:
+                if relevant is not None and not relevant[v]:
+                    continue
+                distances[v] = dist_u + weight
+                predecessors[v] = u
+                hops[v] = hops[u] + 1
+
+                # A shortest path never needs n edges, so this one must go around a negative cycle
+                if hops[v] >= n:
+                    return NegativeCycle(_reachable_from(graph, [_cycle_node(predecessors, v, n)]))
+
+                if not in_queue[v]:
+                    in_queue[v] = True
+                    queue.append(v)
 
     return distances[end] if end is not None else distances
 
 
-def floyd_warshall(graph, start=None, end=None):
+def floyd_warshall(graph, start=None, end=None, next_hop=False, stats=None):
+    # next_hop=True also returns a NextHopMatrix: (result, next_hops)
+    # stats: a Stats collecting the cells updated for each k
+    if stats is not None:
+        return _floyd_warshall_counted(graph, start, end, next_hop, stats)
     n = len(graph)
     dist = [[float('inf')] * n for _ in range(n)]
+    hops = NextHopMatrix(n) if next_hop else None
 
     for i in range(n):
         dist[i][i] = 0
-        for j, weight in graph[i]:
-            dist[i][j] = weight
+        if hops is not None:
+            hops.hops[i * n + i] = i
+    for i, j, weight in _edges(graph):
+        dist[i][j] = weight
+        if hops is not None:
+            hops.hops[i * n + j] = j
     
 
-    for k in range(n):
-        for i in range(n):
-            for j in range(n):
-                if dist[i][k] != float('inf') and dist[k][j] != float('inf'):
-                    dist[i][j] = min(dist[i][j], dist[i][k] + dist[k][j])
+    if hops is None:
+        for k in range(n):
+            for i in range(n):
+                for j in range(n):
+                    if dist[i][k] != float('inf') and dist[k][j] != float('inf'):
+                        dist[i][j] = min(dist[i][j], dist[i][k] + dist[k][j])
+    else:
+        next_hops = hops.hops
+        for k in range(n):
+            for i in range(n):
+                for j in range(n):
+                    if dist[i][k] != float('inf') and dist[k][j] != float('inf'):
+                        if dist[i][k] + dist[k][j] < dist[i][j]:
+                            dist[i][j] = dist[i][k] + dist[k][j]
+                            next_hops[i * n + j] = next_hops[i * n + k]
     
 
     if start is not None and end is not None:
-        return dist[start][end]
-    return dist
+        return _with_predecessors(dist[start][end], hops)
+    return _with_predecessors(dist, hops)
+
+
+# CSRGraph copies of the loops above. They index the offsets, targets and weights
+# arrays directly rather than building a (neighbor, weight) iterator per node. Lists
+# index faster than arrays, which box every element they return, so the buffers are
+# copied with tolist() when the search will touch most edges anyway.
+
+def _dijkstra_csr(graph, start, end, parents):
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    if end is None:
+        offsets, targets, weights = offsets.tolist(), targets.tolist(), weights.tolist()
+    distances = [float('inf')] * len(graph)
+    distances[start] = 0
+    heap = [(0, start)]
+
+    while heap:
+        current_dist, current_node = heapq.heappop(heap)
+        if end is not None and current_node == end:
+            return distances[end]
+        if current_dist > distances[current_node]:
+            continue
+
+        for i in range(offsets[current_node], offsets[current_node + 1]):
+            neighbor = targets[i]
+            new_dist = current_dist + weights[i]
+            if new_dist < distances[neighbor]:
+                distances[neighbor] = new_dist
+                if parents is not None:
+                    parents[neighbor] = current_node
+                heapq.heappush(heap, (new_dist, neighbor))
+
+    return distances[end] if end is not None else distances
+
+
+def _bellman_ford_csr(graph, start, end, predecessors):
+    offsets, targets, weights = graph.offsets.tolist(), graph.targets.tolist(), graph.weights.tolist()
+    n = len(graph)
+    inf = float('inf')
+    distances = [inf] * n
+    distances[start] = 0
+    parents = predecessor_array(n) if predecessors else None
+
+    for _ in range(n - 1):
+        changed = False
+        for u in range(n):
+            dist_u = distances[u]
+            if dist_u == inf:
+                continue
+            for i in range(offsets[u], offsets[u + 1]):
+                v = targets[i]
+                new_dist = dist_u + weights[i]
+                if new_dist < distances[v]:
+                    distances[v] = new_dist
+                    if parents is not None:
+                        parents[v] = u
+                    changed = True
+
+        if not changed:
+            break
+
+    improvable = []
+    for u in range(n):
+        dist_u = distances[u]
+        if dist_u != inf:
+            for i in range(offsets[u], offsets[u + 1]):
+                if dist_u + weights[i] < distances[targets[i]]:
+                    improvable.append(targets[i])
+
+    if improvable:
+        return NegativeCycle(_reachable_from(graph, improvable))
+
+    return _with_predecessors(distances[end] if end is not None else distances, parents)
+
+
+# Instrumented copies of the loops above. They are kept separate so that the default
+# (stats=None) loops carry no counting code at all.
+
+def _dijkstra_counted(graph, start, end, parents, stats):
+    distances = [float('inf')] * len(graph)
+    distances[start] = 0
+    heap = [(0, start)]
+    pushes, pops, stale, relaxations = 1, 0, 0, 0
+
+    try:
+        while heap:
+            current_dist, current_node = heapq.heappop(heap)
+            pops += 1
+
+            if end is not None and current_node == end:
+                return distances[end]
+
+            if current_dist > distances[current_node]:
+                stale += 1
+                continue
+
+            for neighbor, weight in graph[current_node]:
+                new_dist = current_dist + weight
+                if new_dist < distances[neighbor]:
+                    distances[neighbor] = new_dist
+                    relaxations += 1
+                    if parents is not None:
+                        parents[neighbor] = current_node
+                    heapq.heappush(heap, (new_dist, neighbor))
+                    pushes += 1
+
+        return distances[end] if end is not None else distances
+    finally:
+        counters = stats.counters
+        counters['heap_pushes'] += pushes
+        counters['heap_pops'] += pops
+        counters['stale_pops'] += stale
+        counters['relaxations'] += relaxations
+
+
+def _bellman_ford_counted(graph, start, end, predecessors, stats):
+    n = len(graph)
+    distances = [float('inf')] * n
+    distances[start] = 0
+    parents = predecessor_array(n) if predecessors else None
+    passes, relaxations = 0, 0
+
+    with stats.phase('relax'):
+        for _ in range(n - 1):
+            passes += 1
+            changed = False
+            for u in range(n):
+                dist_u = distances[u]
+                if dist_u == float('inf'):
+                    continue
+                for v, weight in graph[u]:
+                    if dist_u + weight < distances[v]:
+                        distances[v] = dist_u + weight
+                        relaxations += 1
+                        if parents is not None:
+                            parents[v] = u
+                        changed = True
+
+            if not changed:
+                break
+    stats.counters['passes'] += passes
+    stats.counters['relaxations'] += relaxations
+
+    with stats.phase('cycle_check'):
+        improvable = []
+        for u in range(n):
+            for v, weight in graph[u]:
+                if distances[u] != float('inf') and distances[u] + weight < distances[v]:
+                    improvable.append(v)
+
+        if improvable:
+            return NegativeCycle(_reachable_from(graph, improvable))
+
+    return _with_predecessors(distances[end] if end is not None else distances, parents)
+
+
+def _floyd_warshall_counted(graph, start, end, next_hop, stats):
+    n = len(graph)
+    hops = NextHopMatrix(n) if next_hop else None
+    next_hops = hops.hops if hops is not None else None
+
+    with stats.phase('init'):
+        dist = [[float('inf')] * n for _ in range(n)]
+        for i in range(n):
+            dist[i][i] = 0
+            if next_hops is not None:
+                next_hops[i * n + i] = i
+            for j, weight in graph[i]:
+                dist[i][j] = weight
+                if next_hops is not None:
+                    next_hops[i * n + j] = j
+
+    updated_per_k = stats.series['cells_updated']
+    with stats.phase('relax'):
+        for k in range(n):
+            updated = 0
+            for i in range(n):
+                for j in range(n):
+                    if dist[i][k] != float('inf') and dist[k][j] != float('inf'):
+                        if dist[i][k] + dist[k][j] < dist[i][j]:
+                            dist[i][j] = dist[i][k] + dist[k][j]
+                            updated += 1
+                            if next_hops is not None:
+                                next_hops[i * n + j] = next_hops[i * n + k]
+            updated_per_k.append(updated)
+            stats.counters['cells_updated'] += updated
+
+    if start is not None and end is not None:
+        return _with_predecessors(dist[start][end], hops)
+    return _with_predecessors(dist, hops)
+
+
+def _edges(graph):
+    if isinstance(graph, CSRGraph):
+        return graph.edges()
+    return ((u, v, weight) for u in range(len(graph)) for v, weight in graph[u])
+
+
+def _with_predecessors(result, predecessors):
+    return result if predecessors is None else (result, predecessors)
+
+
+def _reachable_from(graph, sources):
+    visited = set(sources)
+    queue = deque(visited)
+
+    while queue:
+        node = queue.popleft()
+        for neighbor, _ in graph[node]:
+            if neighbor not in visited:
+                visited.add(neighbor)
+                queue.append(neighbor)
+
+    return visited
+
+
+def _cycle_node(predecessors, node, n):
+    # Walking n predecessor links back from a node whose path has n edges lands on the cycle
+    current = node
+    for _ in range(n):
+        current = predecessors[current]
+        if current == -1:
+            return node
+    return current
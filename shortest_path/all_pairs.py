@@ -0,0 +1,145 @@
+from array import array
+from itertools import repeat
+from shortest_path.algorithms import NegativeCycle, dijkstra, spfa
+from shortest_path.graph import CSRGraph, typecode_of
+
+INF = float('inf')
+DEFAULT_BLOCK_SIZE = 128
+
+
+def blocked_floyd_warshall(graph, start=None, end=None, block_size=DEFAULT_BLOCK_SIZE):
+    # Same contract as algorithms.floyd_warshall, computed on one contiguous n*n buffer
+    n = len(graph)
+    dist, integral = _distance_buffer(graph)
+    _floyd_warshall_blocked(dist, n, block_size)
+
+    if start is not None and end is not None:
+        return _restore(dist[start * n + end], integral)
+    return [[_restore(d, integral) for d in dist[i * n:(i + 1) * n]] for i in range(n)]
+
+
+def johnson(graph, start=None, end=None, stream=False):
+    # Reweight once with Bellman-Ford potentials so every edge is non-negative,
+    # then answer from one dijkstra run per source
+    potentials = spfa(_WithVirtualSource(graph), len(graph))
+    if isinstance(potentials, NegativeCycle):
+        return potentials
+    reweighted = _reweight(graph, potentials)
+
+    if start is not None and end is not None:
+        return _restore_distance(dijkstra(reweighted, start, end), potentials, start, end)
+
+    rows = _johnson_rows(reweighted, potentials)
+    return rows if stream else list(rows)
+
+
+def _johnson_rows(reweighted, potentials):
+    for source in range(len(reweighted)):
+        row = dijkstra(reweighted, source)
+        yield [_restore_distance(d, potentials, source, target) for target, d in enumerate(row)]
+
+
+def _restore_distance(distance, potentials, source, target):
+    if distance == INF:
+        return INF
+    return distance - potentials[source] + potentials[target]
+
+
+def _reweight(graph, potentials):
+    if isinstance(graph, CSRGraph):
+        weights = array(typecode_of(graph.weights),
+                        (w + potentials[u] - potentials[v] for u, v, w in graph.edges()))
+        return CSRGraph(graph.offsets, graph.targets, weights)
+
+    return [[(v, w + potentials[u] - potentials[v]) for v, w in graph[u]] for u in range(len(graph))]
+
+
+class _WithVirtualSource:
+    # The graph plus one extra node with a zero-weight edge to every other node
+    def __init__(self, graph):
+        self.graph = graph
+        self.n = len(graph)
+
+    def __len__(self):
+        return self.n + 1
+
+    def __getitem__(self, node):
+        if node == self.n:
+            return zip(range(self.n), repeat(0))
+        return self.graph[node]
+
+
+def _distance_buffer(graph):
+    n = len(graph)
+    dist = array('d', [INF]) * (n * n)
+    integral = True
+
+    for i in range(n):
+        dist[i * n + i] = 0
+        for j, weight in graph[i]:
+            dist[i * n + j] = weight
+            integral = integral and type(weight) is int
+
+    return dist, integral
+
+
+def _restore(value, integral):
+    # The buffer holds doubles; hand integer results back as ints like floyd_warshall does
+    return int(value) if integral and value != INF else value
+
+
+def _floyd_warshall_blocked(dist, n, block_size, first_block=0, on_block_done=None):
+    # Three-phase blocked Floyd-Warshall: for every k-block, the diagonal tile is
+    # closed first, then the tiles sharing its row and column, then everything else.
+    blocks = [(b, min(b + block_size, n)) for b in range(0, n, block_size)]
+
+    for kb in range(first_block, len(blocks)):
+        k_range = blocks[kb]
+        diagonal = _load_tile(dist, n, k_range, k_range)
+        _relax_tile(diagonal, diagonal, diagonal)
+        _store_tile(dist, n, k_range, k_range, diagonal)
+
+        for other in blocks:
+            if other == k_range:
+                continue
+            row_tile = _load_tile(dist, n, k_range, other)
+            _relax_tile(row_tile, diagonal, row_tile)
+            _store_tile(dist, n, k_range, other, row_tile)
+
+            col_tile = _load_tile(dist, n, other, k_range)
+            _relax_tile(col_tile, col_tile, diagonal)
+            _store_tile(dist, n, other, k_range, col_tile)
+
+        for i_range in blocks:
+            if i_range == k_range:
+                continue
+            left = _load_tile(dist, n, i_range, k_range)
+            for j_range in blocks:
+                if j_range == k_range:
+                    continue
+                right = _load_tile(dist, n, k_range, j_range)
+                tile = _load_tile(dist, n, i_range, j_range)
+                _relax_tile(tile, left, right)
+                _store_tile(dist, n, i_range, j_range, tile)
+
+        if on_block_done is not None:
+            on_block_done(kb)
+
+
+def _load_tile(dist, n, rows, cols):
+    return [dist[r * n + cols[0]:r * n + cols[1]].tolist() for r in range(*rows)]
+
+
+def _store_tile(dist, n, rows, cols, tile):
+    for r, row in zip(range(*rows), tile):
+        dist[r * n + cols[0]:r * n + cols[1]] = array('d', row)
+
+
+def _relax_tile(tile, left, right):
+    # tile[i][j] = min(tile[i][j], left[i][k] + right[k][j]), one whole row per step
+    for k, row_k in enumerate(right):
+        for i, row_i in enumerate(tile):
+            dist_ik = left[i][k]
+            if dist_ik == INF:
+                continue
+            tile[i] = [a if a <= b else b for a, b in zip(row_i, [dist_ik + d for d in row_k])]
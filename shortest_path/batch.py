@@ -0,0 +1,38 @@
+from shortest_path.solver import ShortestPathSolver
+
+INF = float('inf')
+
+
+def many_to_many(graph, sources, targets, hierarchy=None):
+    # Dense len(sources) x len(targets) distance table. Without a hierarchy every source
+    # runs one Dijkstra that stops once all targets are settled, on a shared workspace.
+    targets = list(targets)
+    if hierarchy is not None:
+        return _bucket_many_to_many(hierarchy, sources, targets)
+
+    solver = ShortestPathSolver(graph)
+    return [solver.distances_to(source, targets) for source in sources]
+
+
+def one_to_many(graph, source, targets):
+    return many_to_many(graph, [source], targets)[0]
+
+
+def _bucket_many_to_many(hierarchy, sources, targets):
+    # Bucket-based many-to-many on a contraction hierarchy: one backward upward search
+    # per target fills per-node buckets, then one forward upward search per source
+    # scans the buckets of the nodes it reaches.
+    buckets = {}
+    for column, target in enumerate(targets):
+        for node, distance in hierarchy.upward_search(target, backward=True).items():
+            buckets.setdefault(node, []).append((column, distance))
+
+    table = []
+    for source in sources:
+        row = [INF] * len(targets)
+        for node, distance in hierarchy.upward_search(source).items():
+            for column, remaining in buckets.get(node, ()):
+                if distance + remaining < row[column]:
+                    row[column] = distance + remaining
+        table.append(row)
+    return table
@@ -0,0 +1,67 @@
+import heapq
+from shortest_path.graph import reverse_adjacency
+
+INF = float('inf')
+
+
+def bidirectional_dijkstra(graph, start, end, return_path=False, reverse=None, reachability=None):
+    # Dijkstra forward from start and backward from end on the reversed graph. Pass
+    # `reverse` to reuse a reversed adjacency list across queries; CSRGraph caches its own.
+    if start == end:
+        return (0, [start]) if return_path else 0
+    if reachability is not None and not reachability.reachable(start, end):
+        return (INF, None) if return_path else INF
+    if reverse is None:
+        reverse = reverse_adjacency(graph)
+
+    graphs = (graph, reverse)
+    distances = ({start: 0}, {end: 0})
+    predecessors = ({start: None}, {end: None})
+    heaps = ([(0, start)], [(0, end)])
+    best = INF
+    meeting = None
+
+    while heaps[0] and heaps[1]:
+        # No undiscovered path can be shorter than the two frontiers combined
+        if heaps[0][0][0] + heaps[1][0][0] >= best:
+            break
+
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        current_dist, current_node = heapq.heappop(heaps[side])
+        own = distances[side]
+        if current_dist > own[current_node]:
+            continue
+
+        other = distances[1 - side]
+        for neighbor, weight in graphs[side][current_node]:
+            new_dist = current_dist + weight
+            if new_dist < own.get(neighbor, INF):
+                own[neighbor] = new_dist
+                predecessors[side][neighbor] = current_node
+                heapq.heappush(heaps[side], (new_dist, neighbor))
+
+                if neighbor in other and new_dist + other[neighbor] < best:
+                    best = new_dist + other[neighbor]
+                    meeting = neighbor
+
+    if not return_path:
+        return best
+    if meeting is None:
+        return best, None
+    return best, _join_path(predecessors, meeting)
+
+
+def _join_path(predecessors, meeting):
+    forward, backward = predecessors
+    path = []
+    node = meeting
+    while node is not None:
+        path.append(node)
+        node = forward[node]
+    path.reverse()
+
+    node = backward[meeting]
+    while node is not None:
+        path.append(node)
+        node = backward[node]
+    return path
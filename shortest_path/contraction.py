@@ -0,0 +1,231 @@
+import heapq
+import time
+from shortest_path.graph import CSRGraph
+
+INF = float('inf')
+
+
+class ContractionHierarchy:
+    """
+    Contraction hierarchy over a static graph with non-negative weights.
+
+    Nodes are contracted from least to most important; every contraction adds the
+    shortcut edges needed to preserve distances between the remaining nodes. A query
+    is a bidirectional search that only moves towards more important nodes.
+    """
+
+    def __init__(self, rank, upward, downward, middle, report):
+        self.rank = rank
+        self.upward = upward
+        self.downward = downward
+        self.middle = middle
+        self.report = report
+
+    @classmethod
+    def build(cls, graph, witness_limit=64):
+        begin = time.perf_counter()
+        n = len(graph)
+        out_edges = [{} for _ in range(n)]
+        in_edges = [{} for _ in range(n)]
+        original_edges = 0
+        for u in range(n):
+            for v, weight in graph[u]:
+                original_edges += 1
+                if u != v and weight < out_edges[u].get(v, INF):
+                    out_edges[u][v] = weight
+                    in_edges[v][u] = weight
+
+        middle = {}
+        rank = [0] * n
+        contracted = [False] * n
+        contracted_neighbors = [0] * n
+        upward = [[] for _ in range(n)]
+        downward = [[] for _ in range(n)]
+
+        queue = [(_priority(x, out_edges, in_edges, contracted_neighbors, witness_limit), x) for x in range(n)]
+        heapq.heapify(queue)
+        order = 0
+        while queue:
+            _, x = heapq.heappop(queue)
+            if contracted[x]:
+                continue
+            # Lazy update: priorities drift as neighbours get contracted
+            shortcuts = _shortcuts(x, out_edges, in_edges, witness_limit)
+            priority = _edge_difference(x, shortcuts, out_edges, in_edges, contracted_neighbors)
+            if queue and priority > queue[0][0]:
+                heapq.heappush(queue, (priority, x))
+                continue
+
+            for u, v, weight in shortcuts:
+                out_edges[u][v] = weight
+                in_edges[v][u] = weight
+                middle[(u, v)] = x
+
+            # Every edge still attached to x leads to a node contracted later
+            upward[x] = list(out_edges[x].items())
+            downward[x] = list(in_edges[x].items())
+            for v in out_edges[x]:
+                del in_edges[v][x]
+                contracted_neighbors[v] += 1
+            for u in in_edges[x]:
+                del out_edges[u][x]
+                contracted_neighbors[u] += 1
+            out_edges[x] = {}
+            in_edges[x] = {}
+
+            contracted[x] = True
+            rank[x] = order
+            order += 1
+
+        report = {
+            'build_seconds': time.perf_counter() - begin,
+            'nodes': n,
+            'original_edges': original_edges,
+            'shortcuts': len(middle),
+            'upward_edges': sum(len(edges) for edges in upward),
+            'downward_edges': sum(len(edges) for edges in downward),
+        }
+        return cls(rank, CSRGraph.from_adjacency(upward), CSRGraph.from_adjacency(downward), middle, report)
+
+    def query(self, start, end, return_path=False):
+        if start == end:
+            return (0, [start]) if return_path else 0
+
+        graphs = (self.upward, self.downward)
+        distances = ({start: 0}, {end: 0})
+        predecessors = ({start: None}, {end: None})
+        heaps = ([(0, start)], [(0, end)])
+        best = INF
+        meeting = None
+
+        while heaps[0] or heaps[1]:
+            # Each side stops on its own once its frontier cannot improve on the best meeting
+            for side in (0, 1):
+                heap = heaps[side]
+                if heap and heap[0][0] >= best:
+                    heap.clear()
+                if not heap:
+                    continue
+
+                current_dist, current_node = heapq.heappop(heap)
+                own = distances[side]
+                if current_dist > own[current_node]:
+                    continue
+                other_dist = distances[1 - side].get(current_node, INF)
+                if current_dist + other_dist < best:
+                    best = current_dist + other_dist
+                    meeting = current_node
+
+                for neighbor, weight in graphs[side][current_node]:
+                    new_dist = current_dist + weight
+                    if new_dist < own.get(neighbor, INF):
+                        own[neighbor] = new_dist
+                        predecessors[side][neighbor] = current_node
+                        heapq.heappush(heap, (new_dist, neighbor))
+
+        if not return_path:
+            return best
+        if meeting is None:
+            return best, None
+        return best, self._unpack_route(predecessors, meeting)
+
+    def upward_search(self, node, backward=False):
+        # Exhaustive search from node that only climbs the hierarchy; {reached node: distance}
+        graph = self.downward if backward else self.upward
+        distances = {node: 0}
+        heap = [(0, node)]
+        while heap:
+            current_dist, current_node = heapq.heappop(heap)
+            if current_dist > distances[current_node]:
+                continue
+            for neighbor, weight in graph[current_node]:
+                new_dist = current_dist + weight
+                if new_dist < distances.get(neighbor, INF):
+                    distances[neighbor] = new_dist
+                    heapq.heappush(heap, (new_dist, neighbor))
+        return distances
+
+    def _unpack_route(self, predecessors, meeting):
+        forward, backward = predecessors
+        route = [meeting]
+        node = forward[meeting]
+        while node is not None:
+            route.append(node)
+            node = forward[node]
+        route.reverse()
+
+        node = backward[meeting]
+        while node is not None:
+            route.append(node)
+            node = backward[node]
+
+        path = [route[0]]
+        for u, v in zip(route, route[1:]):
+            path.extend(self._unpack_edge(u, v))
+        return path
+
+    def _unpack_edge(self, u, v):
+        # Nodes after u on the original path behind edge (u, v), expanded iteratively
+        path = []
+        stack = [(u, v)]
+        while stack:
+            a, b = stack.pop()
+            x = self.middle.get((a, b))
+            if x is None:
+                path.append(b)
+            else:
+                stack.append((x, b))
+                stack.append((a, x))
+        return path
+
+
+def _witness_distances(source, excluded, targets, limit, out_edges, settle_limit):
+    # Bounded Dijkstra in the remaining graph that never passes through `excluded`
+    distances = {source: 0}
+    heap = [(0, source)]
+    remaining = set(targets)
+    settled = 0
+
+    while heap and remaining and settled < settle_limit:
+        current_dist, current_node = heapq.heappop(heap)
+        if current_dist > distances[current_node]:
+            continue
+        if current_dist > limit:
+            break
+        settled += 1
+        remaining.discard(current_node)
+        for neighbor, weight in out_edges[current_node].items():
+            if neighbor == excluded:
+                continue
+            new_dist = current_dist + weight
+            if new_dist < distances.get(neighbor, INF):
+                distances[neighbor] = new_dist
+                heapq.heappush(heap, (new_dist, neighbor))
+
+    return distances
+
+
+def _shortcuts(x, out_edges, in_edges, witness_limit):
+    shortcuts = []
+    for u, weight_in in in_edges[x].items():
+        targets = [v for v in out_edges[x] if v != u]
+        if not targets:
+            continue
+        limit = weight_in + max(out_edges[x][v] for v in targets)
+        witness = _witness_distances(u, x, targets, limit, out_edges, witness_limit)
+        for v in targets:
+            through_x = weight_in + out_edges[x][v]
+            if through_x < witness.get(v, INF):
+                shortcuts.append((u, v, through_x))
+    return shortcuts
+
+
+def _priority(x, out_edges, in_edges, contracted_neighbors, witness_limit):
+    shortcuts = _shortcuts(x, out_edges, in_edges, witness_limit)
+    return _edge_difference(x, shortcuts, out_edges, in_edges, contracted_neighbors)
+
+
+def _edge_difference(x, shortcuts, out_edges, in_edges, contracted_neighbors):
+    # Edge difference plus a term that spreads contraction evenly over the graph
+    removed = len(out_edges[x]) + len(in_edges[x])
+    return len(shortcuts) - removed + contracted_neighbors[x]
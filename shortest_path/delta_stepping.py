@@ -0,0 +1,118 @@
+from multiprocessing import Pool
+from shortest_path import parallel
+from shortest_path.graph import CSRGraph
+from shortest_path.parallel import SharedCSR
+
+INF = float('inf')
+# Frontiers smaller than this are relaxed in the calling process even when a pool is
+# available; shipping a handful of nodes to workers costs more than relaxing them
+PARALLEL_MIN_FRONTIER = 512
+
+
+def delta_stepping(graph, start, end=None, delta=None, processes=None):
+    # Single-source shortest paths for non-negative weights. Tentative distances are
+    # grouped into buckets of width delta; a bucket is emptied by relaxing the light
+    # edges (weight <= delta) of all its nodes in bulk, repeating while relaxations
+    # refill it, and then relaxing their heavy edges once. With processes set, large
+    # frontiers are split over a process pool that reads the graph from shared memory.
+    low, high = _weight_bounds(graph)
+    if low is not None and low < 0:
+        raise ValueError("delta_stepping needs non-negative edge weights")
+    if delta is None:
+        delta = default_delta(graph, high)
+    if delta <= 0:
+        raise ValueError(f"delta must be positive: {delta}")
+
+    if not processes or processes < 2:
+        return _delta_stepping(graph, start, end, delta, _relax_requests)
+
+    csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_adjacency(graph)
+    shared = SharedCSR(csr)
+    try:
+        with Pool(processes, parallel._attach_worker, (shared.descriptor, None)) as pool:
+            return _delta_stepping(csr, start, end, delta, _pooled(pool, processes))
+    finally:
+        shared.close()
+
+
+def default_delta(graph, high=None):
+    # Maximum weight over average degree: wide enough that a bucket holds a useful
+    # amount of work, narrow enough that few nodes are relaxed before they settle
+    n = len(graph)
+    if high is None:
+        high = _weight_bounds(graph)[1]
+    if not n or not high:
+        return 1
+    edges = graph.edge_count if isinstance(graph, CSRGraph) else sum(len(graph[u]) for u in range(n))
+    return max(1, high / max(1.0, edges / n))
+
+
+def _delta_stepping(graph, start, end, delta, requests):
+    distances = [INF] * len(graph)
+    distances[start] = 0
+    buckets = {0: {start}}
+
+    def relax(pairs):
+        for v, new_dist in pairs:
+            old = distances[v]
+            if new_dist < old:
+                if old != INF:
+                    bucket = buckets.get(int(old // delta))
+                    if bucket is not None:
+                        bucket.discard(v)
+                distances[v] = new_dist
+                buckets.setdefault(int(new_dist // delta), set()).add(v)
+
+    while buckets:
+        index = min(buckets)
+        settled = []
+        # Light edges can land back in the current bucket, so it is emptied repeatedly
+        while buckets.get(index):
+            frontier = buckets.pop(index)
+            settled.extend(frontier)
+            relax(requests(graph, [(u, distances[u]) for u in frontier], delta, True))
+        buckets.pop(index, None)
+        relax(requests(graph, [(u, distances[u]) for u in settled], delta, False))
+
+        # Every node left in a bucket is at least (index + 1) * delta away
+        if end is not None and distances[end] < (index + 1) * delta:
+            return distances[end]
+
+    return distances[end] if end is not None else distances
+
+
+def _relax_requests(graph, frontier, delta, light):
+    # (node, distance) pairs for the light or heavy edges out of the frontier
+    requests = []
+    for u, dist_u in frontier:
+        for v, weight in graph[u]:
+            if (weight <= delta) == light:
+                requests.append((v, dist_u + weight))
+    return requests
+
+
+def _pooled(pool, processes):
+    def requests(graph, frontier, delta, light):
+        if len(frontier) < PARALLEL_MIN_FRONTIER:
+            return _relax_requests(graph, frontier, delta, light)
+        size = -(-len(frontier) // processes)
+        chunks = [(frontier[i:i + size], delta, light) for i in range(0, len(frontier), size)]
+        return [pair for result in pool.map(_worker_requests, chunks) for pair in result]
+    return requests
+
+
+def _worker_requests(task):
+    # Keeps only the best request per target so less has to travel back
+    frontier, delta, light = task
+    best = {}
+    for v, new_dist in _relax_requests(parallel._worker['graph'], frontier, delta, light):
+        if new_dist < best.get(v, INF):
+            best[v] = new_dist
+    return list(best.items())
+
+
+def _weight_bounds(graph):
+    if isinstance(graph, CSRGraph):
+        return graph.weight_range()
+    weights = [weight for u in range(len(graph)) for _, weight in graph[u]]
+    return (min(weights), max(weights)) if weights else (None, None)
@@ -0,0 +1,177 @@
+import heapq
+from shortest_path.algorithms import dijkstra, floyd_warshall, spfa
+from shortest_path.paths import predecessor_path
+
+INF = float('inf')
+# Slack when testing whether an edge lies on a shortest path, so that float rounding
+# errs towards recomputing a row rather than leaving a stale one
+EPSILON = 1e-9
+
+
+class _DynamicGraph:
+    # Mutable copy of the graph as one {target: weight} dict per node, plus the
+    # reverse direction; parallel edges collapse to the lightest one
+    def __init__(self, graph):
+        n = len(graph)
+        self.adjacency = [{} for _ in range(n)]
+        self.reverse = [{} for _ in range(n)]
+        self.negative_edges = 0
+        for u in range(n):
+            for v, weight in graph[u]:
+                if weight < self.adjacency[u].get(v, INF):
+                    self._set(u, v, weight)
+
+    def __len__(self):
+        return len(self.adjacency)
+
+    def __getitem__(self, node):
+        return self.adjacency[node].items()
+
+    def weight(self, u, v):
+        return self.adjacency[u].get(v, INF)
+
+    def _set(self, u, v, weight):
+        old = self.adjacency[u].get(v, INF)
+        self.negative_edges += (weight < 0) - (old < 0)
+        if weight == INF:
+            self.adjacency[u].pop(v, None)
+            self.reverse[v].pop(u, None)
+        else:
+            self.adjacency[u][v] = weight
+            self.reverse[v][u] = weight
+        return old
+
+
+class DynamicAllPairs(_DynamicGraph):
+    """
+    All-pairs distance matrix kept current under edge updates. Inserting an edge or
+    lowering its weight is folded into the matrix in O(n^2); raising a weight or
+    deleting an edge recomputes only the rows whose shortest paths used that edge.
+    """
+
+    def __init__(self, graph):
+        super().__init__(graph)
+        self.matrix = floyd_warshall(self)
+        # floyd_warshall lets a self-loop overwrite the zero diagonal; an empty path is shorter
+        for i, row in enumerate(self.matrix):
+            row[i] = min(row[i], 0)
+
+    def distance(self, start, end):
+        return self.matrix[start][end]
+
+    def update_edge(self, u, v, weight):
+        # Inserts the edge u -> v or changes its weight
+        old = self.weight(u, v)
+        if weight < old:
+            self._decrease(u, v, weight)
+        elif weight > old:
+            self._set(u, v, weight)
+            self._recompute_rows(u, v, old)
+
+    def remove_edge(self, u, v):
+        self.update_edge(u, v, INF)
+
+    def _decrease(self, u, v, weight):
+        dist = self.matrix
+        if dist[v][u] + weight < 0:
+            raise ValueError(f"Edge {u} -> {v} with weight {weight} would create a negative cycle")
+        self._set(u, v, weight)
+
+        # Every improved path is i ~> u -> v ~> j; the snapshots keep the update exact
+        # even when row v or column u change along the way
+        to_u = [row[u] for row in dist]
+        from_v = dist[v][:]
+        for i, dist_iu in enumerate(to_u):
+            if dist_iu == INF:
+                continue
+            via = dist_iu + weight
+            row = dist[i]
+            if via + from_v[v] >= row[v]:
+                # i already reaches v at least as cheaply, so no path through the edge helps
+                continue
+            for j, dist_vj in enumerate(from_v):
+                if via + dist_vj < row[j]:
+                    row[j] = via + dist_vj
+
+    def _recompute_rows(self, u, v, old):
+        single_source = spfa if self.negative_edges else dijkstra
+        for i, row in enumerate(self.matrix):
+            if row[u] != INF and row[u] + old <= row[v] + EPSILON:
+                self.matrix[i] = single_source(self, i)
+
+
+class DynamicSingleSource(_DynamicGraph):
+    """
+    Shortest path tree from one source kept current under edge updates, for
+    non-negative weights. A lower weight or a new edge propagates from its head with
+    a Dijkstra pass over the nodes that improve; a higher weight or a deleted tree
+    edge resets and recomputes only the subtree hanging below it.
+    """
+
+    def __init__(self, graph, source):
+        super().__init__(graph)
+        if self.negative_edges:
+            raise ValueError("DynamicSingleSource needs non-negative edge weights")
+        self.source = source
+        self.distances, self.predecessors = dijkstra(self, source, queue='heap', predecessors=True)
+
+    def distance(self, end):
+        return self.distances[end]
+
+    def path(self, end):
+        return predecessor_path(self.predecessors, self.source, end)
+
+    def update_edge(self, u, v, weight):
+        if weight < 0:
+            raise ValueError("DynamicSingleSource needs non-negative edge weights")
+        old = self._set(u, v, weight)
+        if weight < old:
+            if self.distances[u] + weight < self.distances[v]:
+                self.distances[v] = self.distances[u] + weight
+                self.predecessors[v] = u
+                self._propagate([(self.distances[v], v)])
+        elif weight > old and self.predecessors[v] == u:
+            self._repair_subtree(v)
+
+    def remove_edge(self, u, v):
+        self.update_edge(u, v, INF)
+
+    def _propagate(self, heap):
+        distances = self.distances
+        predecessors = self.predecessors
+        heapq.heapify(heap)
+        while heap:
+            current_dist, current_node = heapq.heappop(heap)
+            if current_dist > distances[current_node]:
+                continue
+            for neighbor, weight in self.adjacency[current_node].items():
+                new_dist = current_dist + weight
+                if new_dist < distances[neighbor]:
+                    distances[neighbor] = new_dist
+                    predecessors[neighbor] = current_node
+                    heapq.heappush(heap, (new_dist, neighbor))
+
+    def _repair_subtree(self, root):
+        distances = self.distances
+        predecessors = self.predecessors
+
+        # Nodes whose tree path runs through root; every other distance is unaffected
+        subtree = [root]
+        for node in subtree:
+            for child in self.adjacency[node]:
+                if predecessors[child] == node and child != root:
+                    subtree.append(child)
+        for node in subtree:
+            distances[node] = INF
+            predecessors[node] = -1
+
+        # Re-enter the subtree from its best unaffected in-neighbours, then settle it
+        heap = []
+        for node in subtree:
+            for parent, weight in self.reverse[node].items():
+                if distances[parent] + weight < distances[node]:
+                    distances[node] = distances[parent] + weight
+                    predecessors[node] = parent
+            if distances[node] != INF:
+                heap.append((distances[node], node))
+        self._propagate(heap)
@@ -0,0 +1,192 @@
+from array import array
+from shortest_path.algorithms import NegativeCycle, _reachable_from
+from shortest_path.graph import CSRGraph, index_typecode, weight_typecode
+
+INF = float('inf')
+
+
+class EdgeList:
+    """
+    A graph as three parallel arrays of edge sources, targets and weights. Bellman-Ford
+    relaxes every edge once per pass, so one flat sweep over the arrays replaces the
+    per-node adjacency walk and its unreachable-node checks.
+
+    Building one costs about as much as a whole Bellman-Ford run, so the sweeps only
+    pay off when the same EdgeList answers many sources.
+    """
+
+    def __init__(self, n, sources, targets, weights):
+        if not len(sources) == len(targets) == len(weights):
+            raise ValueError("sources, targets and weights must have the same length")
+        self.n = n
+        self.sources = sources
+        self.targets = targets
+        self.weights = weights
+        self._edges = None
+
+    @classmethod
+    def from_graph(cls, graph):
+        if isinstance(graph, EdgeList):
+            return graph
+        n = len(graph)
+        edges = graph.edges() if isinstance(graph, CSRGraph) else ((u, v, w) for u in range(n) for v, w in graph[u])
+        sources, targets, weights = [], [], []
+        for u, v, w in edges:
+            sources.append(u)
+            targets.append(v)
+            weights.append(w)
+        typecode = index_typecode(n)
+        return cls(n, array(typecode, sources), array(typecode, targets), array(weight_typecode(weights), weights))
+
+    def edge_tuples(self):
+        # (source, target, weight) tuples, built once: unpacking them is the cheapest
+        # way to walk all edges in a pass
+        if self._edges is None:
+            self._edges = list(zip(self.sources, self.targets, self.weights))
+        return self._edges
+
+    def bellman_ford(self, start, end=None):
+        # Same results as algorithms.bellman_ford, including NegativeCycle
+        distances, improvable = _relax(self.edge_tuples(), self.n, start)
+        if improvable:
+            return NegativeCycle(_reachable_from(self.adjacency(), improvable))
+        return distances[end] if end is not None else distances
+
+    def adjacency(self):
+        graph = [[] for _ in range(self.n)]
+        for u, v, w in zip(self.sources, self.targets, self.weights):
+            graph[u].append((v, w))
+        return graph
+
+    def __len__(self):
+        return self.n
+
+
+class EdgeListBatch:
+    """
+    Several graphs as one EdgeList over their disjoint union. The nodes of graph k are
+    renumbered from node_offsets[k], and its edges are the slice
+    edge_offsets[k]:edge_offsets[k + 1] of the union. The conversion is paid once for
+    the whole batch, and a batch can be solved again for other start nodes.
+    """
+
+    def __init__(self, graphs):
+        self.node_offsets = [0]
+        self.edge_offsets = [0]
+        edges = []
+        for graph in graphs:
+            offset = self.node_offsets[-1]
+            if isinstance(graph, EdgeList):
+                edges.extend((u + offset, v + offset, w) for u, v, w in graph.edge_tuples())
+            else:
+                for u in range(len(graph)):
+                    source = u + offset
+                    edges.extend([(source, v + offset, w) for v, w in graph[u]])
+            self.node_offsets.append(offset + len(graph))
+            self.edge_offsets.append(len(edges))
+        n = self.node_offsets[-1]
+        typecode = index_typecode(n)
+        sources, targets, weights = zip(*edges) if edges else ((), (), ())
+        self.union = EdgeList(n, array(typecode, sources), array(typecode, targets),
+                              array(weight_typecode(weights), weights))
+        # The tuples are what the passes walk, so keep them rather than rebuild them
+        self.union._edges = edges
+
+    def __len__(self):
+        return len(self.node_offsets) - 1
+
+
+def batched_bellman_ford(graphs, starts, ends=None):
+    # Solves a stack of graphs, such as the samples of one experiment size, in shared
+    # passes over one EdgeListBatch (built here unless one is passed in). Each graph gets
+    # the result bellman_ford would return for it: a distance, a distance list or a
+    # NegativeCycle. A graph leaves the passes as soon as one of them changes none of its
+    # distances, or after its own n - 1 passes, so a large graph never holds a small one.
+    batch = graphs if isinstance(graphs, EdgeListBatch) else EdgeListBatch(graphs)
+    node_offsets, edge_offsets = batch.node_offsets, batch.edge_offsets
+    edges = batch.union.edge_tuples()
+    distances = [INF] * batch.union.n
+    active = bytearray(batch.union.n)
+    for k, start in enumerate(starts):
+        distances[node_offsets[k] + start] = 0
+        active[node_offsets[k] + start] = 1
+
+    passes_left = [node_offsets[k + 1] - node_offsets[k] - 1 for k in range(len(batch))]
+    running = [k for k in range(len(batch)) if passes_left[k] > 0]
+    # Graphs that ran out of passes while still changing, which only a negative cycle causes
+    unsettled = [k for k in range(len(batch)) if passes_left[k] <= 0]
+    while running:
+        changed = bytearray(batch.union.n)
+        for k in running:
+            for u, v, w in edges[edge_offsets[k]:edge_offsets[k + 1]]:
+                if active[u]:
+                    new_dist = distances[u] + w
+                    if new_dist < distances[v]:
+                        distances[v] = new_dist
+                        active[v] = changed[v] = 1
+
+        still_running = []
+        for k in running:
+            begin, end = node_offsets[k], node_offsets[k + 1]
+            passes_left[k] -= 1
+            if changed.find(1, begin, end) == -1:
+                continue
+            if passes_left[k] > 0:
+                still_running.append(k)
+            else:
+                unsettled.append(k)
+                changed[begin:end] = bytes(end - begin)
+        running = still_running
+        active = changed
+
+    cycles = {}
+    for k in unsettled:
+        offset = node_offsets[k]
+        graph_edges = edges[edge_offsets[k]:edge_offsets[k + 1]]
+        improvable = [v - offset for u, v, w in graph_edges if distances[u] + w < distances[v]]
+        if improvable:
+            adjacency = [[] for _ in range(node_offsets[k + 1] - offset)]
+            for u, v, w in graph_edges:
+                adjacency[u - offset].append((v - offset, w))
+            cycles[k] = NegativeCycle(_reachable_from(adjacency, improvable))
+
+    results = []
+    for k in range(len(batch)):
+        if k in cycles:
+            results.append(cycles[k])
+        elif ends is not None:
+            results.append(distances[node_offsets[k] + ends[k]])
+        else:
+            results.append(distances[node_offsets[k]:node_offsets[k + 1]])
+    return results
+
+
+def _relax(edges, n, start):
+    distances = [INF] * n
+    distances[start] = 0
+    # Sources whose distance changed in the previous pass (or earlier in this one);
+    # edges out of any other node cannot improve anything
+    active = bytearray(n)
+    active[start] = 1
+
+    converged = False
+    for _ in range(n - 1):
+        changed = bytearray(n)
+        converged = True
+        for u, v, w in edges:
+            if active[u]:
+                new_dist = distances[u] + w
+                if new_dist < distances[v]:
+                    distances[v] = new_dist
+                    active[v] = changed[v] = 1
+                    converged = False
+        if converged:
+            break
+        active = changed
+
+    # A pass that changed nothing proves there is no negative cycle; otherwise every
+    # node that can still be improved is reachable from one
+    improvable = []
+    if not converged:
+        improvable = [v for u, v, w in edges if distances[u] + w < distances[v]]
+    return distances, improvable
@@ -0,0 +1,132 @@
+from array import array
+
+
+def index_typecode(n):
+    # Smallest signed array typecode able to hold the node ids 0..n-1 and -1
+    for typecode in ('b', 'h', 'i', 'q'):
+        if n <= 2 ** (8 * array(typecode).itemsize - 1) - 1:
+            return typecode
+    raise OverflowError(f"Too many nodes for an index array: {n}")
+
+
+def weight_typecode(weights):
+    # Integer weights stay exact in a 64-bit int buffer, anything else is stored as double
+    if all(type(w) is int and -2 ** 63 <= w < 2 ** 63 for w in weights):
+        return 'q'
+    return 'd'
+
+
+def typecode_of(buffer):
+    # array exposes typecode, memoryviews over shared or mapped memory expose format
+    return getattr(buffer, 'typecode', None) or buffer.format
+
+
+def reverse_adjacency(graph):
+    # CSRGraph keeps its reverse cached; adjacency lists are flipped on every call
+    if isinstance(graph, CSRGraph):
+        return graph.reverse()
+
+    reverse = [[] for _ in range(len(graph))]
+    for u in range(len(graph)):
+        for v, weight in graph[u]:
+            reverse[v].append((u, weight))
+    return reverse
+
+
+class CSRGraph:
+    """
+    Directed weighted graph stored in compressed sparse row form.
+
+    The outgoing edges of node u are targets[offsets[u]:offsets[u + 1]] with the
+    matching weights. Indexing a CSRGraph yields (neighbor, weight) pairs, so it can
+    be passed anywhere the list-of-tuples adjacency format is accepted; dijkstra,
+    bellman_ford and floyd_warshall walk the three arrays directly instead.
+    """
+
+    def __init__(self, offsets, targets, weights):
+        if len(targets) != len(weights):
+            raise ValueError("targets and weights must have the same length")
+        if len(offsets) == 0 or offsets[-1] != len(targets):
+            raise ValueError("offsets must end with the number of edges")
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self._reverse = None
+        self._weight_range = None
+
+    @classmethod
+    def from_adjacency(cls, graph):
+        n = len(graph)
+        offsets = array('q', [0]) * (n + 1)
+        targets = []
+        weights = []
+
+        for u in range(n):
+            for v, weight in graph[u]:
+                targets.append(v)
+                weights.append(weight)
+            offsets[u + 1] = len(targets)
+
+        return cls(offsets, array(index_typecode(n), targets),
+                   array(weight_typecode(weights), weights))
+
+    def reverse(self):
+        # Graph with every edge flipped, built once by counting sort and then cached
+        if self._reverse is None:
+            n = len(self)
+            offsets = array('q', [0]) * (n + 1)
+            for v in self.targets:
+                offsets[v + 1] += 1
+            for v in range(n):
+                offsets[v + 1] += offsets[v]
+
+            position = offsets[:-1]
+            targets = array(typecode_of(self.targets), [0]) * self.edge_count
+            weights = array(typecode_of(self.weights), [0]) * self.edge_count
+            for u, v, weight in self.edges():
+                i = position[v]
+                targets[i] = u
+                weights[i] = weight
+                position[v] = i + 1
+
+            self._reverse = CSRGraph(offsets, targets, weights)
+            self._reverse._reverse = self
+        return self._reverse
+
+    def weight_range(self):
+        # (smallest, largest) edge weight, or (None, None) without edges; cached
+        if self._weight_range is None:
+            if self.edge_count:
+                self._weight_range = (min(self.weights), max(self.weights))
+            else:
+                self._weight_range = (None, None)
+        return self._weight_range
+
+    def to_adjacency(self):
+        return [list(self[u]) for u in range(len(self))]
+
+    @property
+    def edge_count(self):
+        return len(self.targets)
+
+    def edges(self):
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        for u in range(len(self)):
+            for i in range(offsets[u], offsets[u + 1]):
+                yield u, targets[i], weights[i]
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, node):
+        # memoryview slices share the buffers, so no edge is copied
+        begin = self.offsets[node]
+        end = self.offsets[node + 1]
+        return zip(memoryview(self.targets)[begin:end], memoryview(self.weights)[begin:end])
+
+    def __iter__(self):
+        for u in range(len(self)):
+            yield self[u]
+
+    def __repr__(self):
+        return f"CSRGraph(nodes={len(self)}, edges={self.edge_count})"
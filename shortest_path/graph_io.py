@@ -0,0 +1,99 @@
+import mmap
+import struct
+import sys
+from array import array
+from shortest_path.graph import CSRGraph, index_typecode, typecode_of, weight_typecode
+
+MAGIC = b'SPGR'
+VERSION = 1
+# magic, version, byte order, offset/target/weight typecodes, nodes, edges; padded to 64 bytes
+HEADER = struct.Struct('<4sHBccc2xQQ')
+HEADER_SIZE = 64
+ALIGNMENT = 8
+
+
+def save_graph(graph, path):
+    # Writes a CSRGraph (or an adjacency list, converted first) in the binary format
+    if not isinstance(graph, CSRGraph):
+        graph = CSRGraph.from_adjacency(graph)
+    buffers = (graph.offsets, graph.targets, graph.weights)
+    typecodes = [typecode_of(buffer).encode() for buffer in buffers]
+
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, sys.byteorder == 'big', *typecodes,
+                            len(graph), graph.edge_count).ljust(HEADER_SIZE, b'\0'))
+        for buffer in buffers:
+            data = memoryview(buffer).cast('B')
+            f.write(data)
+            f.write(b'\0' * (-len(data) % ALIGNMENT))
+
+
+def load_graph(path):
+    # Maps the file read-only and returns a CSRGraph whose buffers are views into the
+    # mapping: nothing is copied, and processes loading the same file share its pages
+    with open(path, 'rb') as f:
+        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    if len(mapping) < HEADER_SIZE:
+        raise ValueError(f"Not a graph file: {path}")
+    magic, version, big_endian, *typecodes, n, m = HEADER.unpack_from(mapping)
+    if magic != MAGIC:
+        raise ValueError(f"Not a graph file: {path}")
+    if version != VERSION:
+        raise ValueError(f"Unsupported graph file version {version}: {path}")
+    if big_endian != (sys.byteorder == 'big'):
+        raise ValueError(f"Graph file was written with a different byte order: {path}")
+
+    view = memoryview(mapping)
+    position = HEADER_SIZE
+    buffers = []
+    for typecode, length in zip(typecodes, (n + 1, m, m)):
+        typecode = typecode.decode()
+        size = length * array(typecode).itemsize
+        buffers.append(view[position:position + size].cast(typecode))
+        position += size + (-size % ALIGNMENT)
+    return CSRGraph(*buffers)
+
+
+def read_edge_list(path, n=None):
+    # Text file with one "source target weight" edge per line; '#' starts a comment.
+    # Edges are grouped by source with a counting sort, never as per-node Python lists.
+    sources, targets, weights = array('q'), array('q'), []
+    with open(path) as f:
+        for line in f:
+            fields = line.split('#', 1)[0].split()
+            if not fields:
+                continue
+            u, v, weight = fields
+            sources.append(int(u))
+            targets.append(int(v))
+            weights.append(_parse_weight(weight))
+
+    if n is None:
+        n = max(max(sources, default=-1), max(targets, default=-1)) + 1
+    offsets = array('q', [0]) * (n + 1)
+    for u in sources:
+        offsets[u + 1] += 1
+    for u in range(n):
+        offsets[u + 1] += offsets[u]
+
+    position = offsets[:-1]
+    sorted_targets = array(index_typecode(n), [0]) * len(targets)
+    sorted_weights = array(weight_typecode(weights), [0]) * len(weights)
+    for u, v, weight in zip(sources, targets, weights):
+        i = position[u]
+        sorted_targets[i] = v
+        sorted_weights[i] = weight
+        position[u] = i + 1
+    return CSRGraph(offsets, sorted_targets, sorted_weights)
+
+
+def convert_edge_list(text_path, graph_path, n=None):
+    save_graph(read_edge_list(text_path, n), graph_path)
+
+
+def _parse_weight(text):
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
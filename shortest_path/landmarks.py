@@ -0,0 +1,107 @@
+import heapq
+import random
+import struct
+from array import array
+from shortest_path.algorithms import dijkstra
+from shortest_path.graph import reverse_adjacency
+
+INF = float('inf')
+MAGIC = b'ALT1'
+HEADER = struct.Struct('<4sII')
+
+
+class LandmarkIndex:
+    """
+    Distances to and from a few landmark nodes, used as A* lower bounds (ALT).
+
+    For a landmark L the triangle inequality gives d(v, t) >= d(L, t) - d(L, v) and
+    d(v, t) >= d(v, L) - d(t, L). Requires non-negative weights, like dijkstra.
+    """
+
+    def __init__(self, landmarks, forward, backward):
+        self.landmarks = list(landmarks)
+        self.forward = forward
+        self.backward = backward
+
+    @classmethod
+    def build(cls, graph, count=8, seed=None):
+        n = len(graph)
+        reverse = reverse_adjacency(graph)
+        rng = random.Random(seed)
+        landmarks, forward, backward = [], [], []
+        # Distance from the closest landmark so far; unreachable nodes are the best candidates
+        closest = [INF] * n
+
+        candidate = rng.randrange(n) if n else None
+        while candidate is not None and len(landmarks) < count:
+            landmarks.append(candidate)
+            forward.append(array('d', dijkstra(graph, candidate)))
+            backward.append(array('d', dijkstra(reverse, candidate)))
+
+            for v in range(n):
+                closest[v] = min(closest[v], forward[-1][v] + backward[-1][v])
+            candidate = max((v for v in range(n) if v not in landmarks), key=closest.__getitem__,
+                            default=None)
+
+        return cls(landmarks, forward, backward)
+
+    def save(self, path):
+        with open(path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, len(self.forward[0]) if self.landmarks else 0, len(self.landmarks)))
+            array('q', self.landmarks).tofile(f)
+            for distances in self.forward + self.backward:
+                distances.tofile(f)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            magic, n, count = HEADER.unpack(f.read(HEADER.size))
+            if magic != MAGIC:
+                raise ValueError(f"Not a landmark index file: {path}")
+            landmarks = array('q')
+            landmarks.fromfile(f, count)
+            tables = []
+            for _ in range(2 * count):
+                distances = array('d')
+                distances.fromfile(f, n)
+                tables.append(distances)
+        return cls(landmarks, tables[:count], tables[count:])
+
+    def lower_bound(self, node, end):
+        bound = 0
+        for forward, backward in zip(self.forward, self.backward):
+            from_landmark, to_landmark = forward[node], backward[node]
+            if from_landmark != INF:
+                if forward[end] == INF:
+                    return INF
+                bound = max(bound, forward[end] - from_landmark)
+            if backward[end] != INF:
+                if to_landmark == INF:
+                    return INF
+                bound = max(bound, to_landmark - backward[end])
+        return bound
+
+    def query(self, graph, start, end):
+        # A* guided by the landmark bounds; returns (distance, number of settled nodes)
+        distances = {start: 0}
+        settled = set()
+        heap = [(self.lower_bound(start, end), start)]
+
+        while heap:
+            _, current_node = heapq.heappop(heap)
+            if current_node in settled:
+                continue
+            settled.add(current_node)
+            if current_node == end:
+                return distances[end], len(settled)
+
+            current_dist = distances[current_node]
+            for neighbor, weight in graph[current_node]:
+                new_dist = current_dist + weight
+                if new_dist < distances.get(neighbor, INF):
+                    distances[neighbor] = new_dist
+                    bound = self.lower_bound(neighbor, end)
+                    if bound != INF:
+                        heapq.heappush(heap, (new_dist + bound, neighbor))
+
+        return INF, len(settled)
@@ -0,0 +1,157 @@
+import heapq
+import random
+from array import array
+from shortest_path.graph import CSRGraph, typecode_of
+
+INF = float('inf')
+
+
+class DistanceOracle:
+    """
+    Thorup-Zwick approximate distance oracle with stretch 2k - 1.
+
+    Nodes are sampled into levels V = A_0 > A_1 > ... > A_{k-1}, each keeping about
+    n^(-1/k) of the previous one. Every node stores its nearest node (pivot) on each
+    level and a bunch: the nodes of A_i \\ A_{i+1} that are closer to it than A_{i+1}
+    is, with their exact distances. That is O(k n^(1 + 1/k)) entries in expectation
+    instead of n^2, and a query looks at no more than k bunches.
+
+    The construction needs an undirected graph, so the oracle is built on the graph
+    symmetrized by symmetrize(); distances are those of the undirected graph.
+    Weights must be non-negative.
+    """
+
+    def __init__(self, k, pivots, pivot_distances, bunches, integral=False):
+        self.k = k
+        self.pivots = pivots
+        self.pivot_distances = pivot_distances
+        self.bunches = bunches
+        self.integral = integral
+
+    @classmethod
+    def build(cls, graph, k=2, seed=None):
+        graph = symmetrize(graph)
+        n = len(graph)
+        rng = random.Random(seed)
+        levels = _sample_levels(n, k, rng)
+
+        pivots, pivot_distances = [], []
+        for level in levels:
+            distances, nearest = _nearest(graph, level)
+            pivots.append(nearest)
+            pivot_distances.append(distances)
+
+        # A node of level i (and not i + 1) joins the bunch of every node it is closer
+        # to than level i + 1; those nodes form its cluster, grown by a pruned Dijkstra
+        bunches = [{} for _ in range(n)]
+        for i, level in enumerate(levels):
+            limit = pivot_distances[i + 1] if i + 1 < k else None
+            upper = set(levels[i + 1]) if i + 1 < k else ()
+            for w in level:
+                if w in upper:
+                    continue
+                for v, distance in _cluster(graph, w, limit).items():
+                    bunches[v][w] = distance
+
+        return cls(k, [array('q', p) for p in pivots], [array('d', d) for d in pivot_distances], bunches,
+                   typecode_of(graph.weights) != 'd')
+
+    @property
+    def stretch(self):
+        return 2 * self.k - 1
+
+    @property
+    def size(self):
+        # Stored entries: bunch members plus one pivot per node and level
+        return sum(len(bunch) for bunch in self.bunches) + self.k * len(self.bunches)
+
+    def query(self, u, v):
+        # Climbs the levels, alternating sides, until the pivot of one endpoint is in
+        # the bunch of the other; the result is at most (2k - 1) * d(u, v)
+        if u == v:
+            return 0
+        w, distance_uw = u, 0
+        i = 0
+        while w not in self.bunches[v]:
+            i += 1
+            if i == self.k:
+                return INF
+            u, v = v, u
+            w = self.pivots[i][u]
+            if w == -1:
+                # u reaches no node of this level, so v lies in another component
+                return INF
+            distance_uw = self.pivot_distances[i][u]
+        distance = distance_uw + self.bunches[v][w]
+        # Pivot distances are kept as doubles; integer graphs get integer answers back
+        return int(distance) if self.integral else distance
+
+
+def symmetrize(graph):
+    # Undirected version of a directed graph: u - v gets the lighter of u -> v and v -> u
+    n = len(graph)
+    edges = [{} for _ in range(n)]
+    for u in range(n):
+        for v, weight in graph[u]:
+            if weight < 0:
+                raise ValueError("DistanceOracle needs non-negative edge weights")
+            if u != v and weight < edges[u].get(v, INF):
+                edges[u][v] = weight
+                edges[v][u] = weight
+    return CSRGraph.from_adjacency([list(neighbors.items()) for neighbors in edges])
+
+
+def _sample_levels(n, k, rng):
+    probability = n ** (-1 / k) if n else 0
+    levels = [list(range(n))]
+    for _ in range(1, k):
+        previous = levels[-1]
+        level = [v for v in previous if rng.random() < probability]
+        # The top level must not be empty, or queries could climb past it
+        while not level and previous and len(levels) == k - 1:
+            level = [v for v in previous if rng.random() < probability]
+        levels.append(level)
+    return levels
+
+
+def _nearest(graph, sources):
+    # Multi-source Dijkstra: distance to the closest source and which source it is
+    n = len(graph)
+    distances = [INF] * n
+    nearest = [-1] * n
+    heap = []
+    for s in sources:
+        distances[s] = 0
+        nearest[s] = s
+        heap.append((0, s))
+    heapq.heapify(heap)
+
+    while heap:
+        current_dist, current_node = heapq.heappop(heap)
+        if current_dist > distances[current_node]:
+            continue
+        for neighbor, weight in graph[current_node]:
+            new_dist = current_dist + weight
+            if new_dist < distances[neighbor]:
+                distances[neighbor] = new_dist
+                nearest[neighbor] = nearest[current_node]
+                heapq.heappush(heap, (new_dist, neighbor))
+    return distances, nearest
+
+
+def _cluster(graph, center, limit):
+    # Dijkstra from center that only keeps nodes strictly closer to it than limit[v]
+    distances = {center: 0}
+    heap = [(0, center)]
+    while heap:
+        current_dist, current_node = heapq.heappop(heap)
+        if current_dist > distances[current_node]:
+            continue
+        for neighbor, weight in graph[current_node]:
+            new_dist = current_dist + weight
+            if limit is not None and new_dist >= limit[neighbor]:
+                continue
+            if new_dist < distances.get(neighbor, INF):
+                distances[neighbor] = new_dist
+                heapq.heappush(heap, (new_dist, neighbor))
+    return distances
@@ -0,0 +1,150 @@
+import hashlib
+import json
+import mmap
+import os
+from array import array
+from math import isqrt
+from shortest_path.all_pairs import INF, _floyd_warshall_blocked, _restore
+
+# A loaded tile cell costs a list slot plus a float object
+CELL_BYTES = 32
+# _floyd_warshall_blocked holds at most four tiles at a time: left, right, the tile
+# being relaxed and the new row list built while relaxing it
+TILES_IN_MEMORY = 4
+DEFAULT_MAX_MEMORY = 256 * 1024 * 1024
+
+
+def out_of_core_floyd_warshall(graph, path, max_memory=DEFAULT_MAX_MEMORY, resume=True):
+    # Blocked Floyd-Warshall on an n*n matrix of doubles kept in the file at `path`
+    # and memory-mapped, so only the tiles in flight live in RAM. Tiles are sized so
+    # that they fit in max_memory bytes. Progress is recorded in `path + '.json'`
+    # after every k-block, together with a fingerprint of the graph; calling again
+    # with the same path and graph resumes after the last finished block, while a
+    # different graph starts over. Returns a DiskDistanceMatrix over the finished file.
+    n = len(graph)
+    edges, digest = _fingerprint(graph)
+    progress = _read_progress(path) if resume else None
+    if progress is None or (progress['n'], progress.get('edges'), progress.get('digest')) != (n, edges, digest):
+        integral = _write_initial(graph, path)
+        progress = {'n': n, 'edges': edges, 'digest': digest, 'block_size': block_size_for(max_memory, n),
+                    'integral': integral, 'next_block': 0}
+        _write_progress(path, progress)
+
+    if n:
+        with open(path, 'r+b') as f:
+            mapping = mmap.mmap(f.fileno(), 0)
+        dist = memoryview(mapping).cast('d')
+
+        def on_block_done(kb):
+            # Tiles of a block interrupted halfway only ever hold valid path lengths,
+            # so redoing the whole block after a crash still converges
+            mapping.flush()
+            progress['next_block'] = kb + 1
+            _write_progress(path, progress)
+
+        try:
+            _floyd_warshall_blocked(dist, n, progress['block_size'], progress['next_block'], on_block_done)
+        finally:
+            dist.release()
+            mapping.close()
+
+    return DiskDistanceMatrix(path)
+
+
+def block_size_for(max_memory, n=None):
+    block_size = max(1, isqrt(max_memory // (CELL_BYTES * TILES_IN_MEMORY)))
+    return block_size if n is None else max(1, min(block_size, n))
+
+
+class DiskDistanceMatrix:
+    """
+    Read-only view of a distance matrix written by out_of_core_floyd_warshall.
+    Entries are read from the memory-mapped file on demand.
+    """
+
+    def __init__(self, path):
+        progress = _read_progress(path)
+        if progress is None:
+            raise ValueError(f"No distance matrix progress file for {path}")
+        self.n = progress['n']
+        self.integral = progress['integral']
+        blocks = -(-self.n // progress['block_size'])
+        self.complete = progress['next_block'] >= blocks
+        self._mapping = None
+        self._dist = None
+        if self.n:
+            with open(path, 'rb') as f:
+                self._mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._dist = memoryview(self._mapping).cast('d')
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, index):
+        i, j = index
+        return _restore(self._dist[i * self.n + j], self.integral)
+
+    def row(self, i):
+        return [_restore(d, self.integral) for d in self._dist[i * self.n:(i + 1) * self.n]]
+
+    def rows(self):
+        for i in range(self.n):
+            yield self.row(i)
+
+    def close(self):
+        if self._mapping is not None:
+            self._dist.release()
+            self._mapping.close()
+            self._mapping = self._dist = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _write_initial(graph, path):
+    # Written row by row, so building the file never needs more than one row in memory
+    n = len(graph)
+    integral = True
+    with open(path, 'wb') as f:
+        for i in range(n):
+            row = array('d', [INF]) * n
+            row[i] = 0
+            for j, weight in graph[i]:
+                row[j] = weight
+                integral = integral and type(weight) is int
+            f.write(row.tobytes())
+    return integral
+
+
+def _fingerprint(graph):
+    # Edge count and a hash of every (source, target, weight), so a progress file is
+    # never resumed for another graph of the same size
+    digest = hashlib.sha256()
+    edges = 0
+    for u in range(len(graph)):
+        for v, weight in graph[u]:
+            digest.update(f"{u} {v} {weight!r}\n".encode())
+            edges += 1
+    return edges, digest.hexdigest()
+
+
+def _progress_path(path):
+    return path + '.json'
+
+
+def _read_progress(path):
+    if not os.path.exists(path) or not os.path.exists(_progress_path(path)):
+        return None
+    with open(_progress_path(path)) as f:
+        return json.load(f)
+
+
+def _write_progress(path, progress):
+    # Replaced atomically, so a crash never leaves a half-written progress file
+    temporary = _progress_path(path) + '.tmp'
+    with open(temporary, 'w') as f:
+        json.dump(progress, f)
+    os.replace(temporary, _progress_path(path))
@@ -0,0 +1,155 @@
+import os
+from array import array
+from multiprocessing import Pool, shared_memory
+from shortest_path.algorithms import dijkstra
+from shortest_path.graph import CSRGraph, typecode_of
+
+INF = float('inf')
+
+# Set in every worker process by _attach_worker
+_worker = {}
+
+
+def parallel_all_pairs(graph, processes=None, chunk_size=None, stream=False):
+    # Dijkstra from every source on a process pool; the graph is placed in shared
+    # memory once and each task only carries a range of source nodes. Workers write
+    # into a shared n*n block that is copied into a DistanceMatrix; stream=True yields
+    # the rows as lists instead, without ever holding the whole matrix.
+    csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_adjacency(graph)
+    n = len(csr)
+    processes = processes or os.cpu_count() or 1
+    chunk_size = chunk_size or max(1, n // (processes * 4))
+    ranges = [(s, min(s + chunk_size, n)) for s in range(0, n, chunk_size)]
+    integral = typecode_of(csr.weights) != 'd'
+
+    if stream:
+        return _stream_rows(csr, ranges, processes, integral)
+
+    shared = SharedCSR(csr)
+    output = _create_block(array('d', [INF]) * (n * n))
+    try:
+        with Pool(processes, _attach_worker, (shared.descriptor, _describe(output, 'd', n * n))) as pool:
+            for _ in pool.imap_unordered(_fill_rows, ranges):
+                pass
+        # One memcpy out of the shared block, which is unlinked on the way out
+        values = array('d')
+        data = output.buf[:n * n * values.itemsize]
+        values.frombytes(data)
+        data.release()
+        return DistanceMatrix(n, values, integral)
+    finally:
+        shared.close()
+        _release(output)
+
+
+class DistanceMatrix:
+    """
+    n x n distances returned by parallel_all_pairs, kept in one flat array of doubles
+    rather than n lists of float objects. matrix[i, j] is one entry and row(i) builds
+    the list dijkstra would return for source i.
+    """
+
+    def __init__(self, n, values, integral=False):
+        self.n = n
+        self.values = values
+        self.integral = integral
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, index):
+        i, j = index
+        return _restore(self.values[i * self.n + j], self.integral)
+
+    def row(self, i):
+        return [_restore(d, self.integral) for d in self.values[i * self.n:(i + 1) * self.n]]
+
+    def rows(self):
+        for i in range(self.n):
+            yield self.row(i)
+
+
+def _stream_rows(csr, ranges, processes, integral):
+    shared = SharedCSR(csr)
+    try:
+        with Pool(processes, _attach_worker, (shared.descriptor, None)) as pool:
+            for rows in pool.imap(_solve_rows, ranges):
+                for row in rows:
+                    yield [_restore(d, integral) for d in row]
+    finally:
+        shared.close()
+
+
+class SharedCSR:
+    """
+    Copies the buffers of a CSRGraph into shared memory blocks that worker processes
+    can attach to by name. The creating process must call close() when done.
+    """
+
+    def __init__(self, graph):
+        self.blocks = [_create_block(graph.offsets), _create_block(graph.targets),
+                       _create_block(graph.weights)]
+        self.descriptor = tuple(_describe(block, typecode_of(buffer), len(buffer))
+                                for block, buffer in zip(self.blocks, (graph.offsets, graph.targets,
+                                                                       graph.weights)))
+
+    def close(self):
+        for block in self.blocks:
+            _release(block)
+
+    @staticmethod
+    def attach(descriptor):
+        # Returns the graph and the blocks backing it, which must outlive the graph
+        blocks = [shared_memory.SharedMemory(name=name) for name, _, _ in descriptor]
+        views = [_view(block, typecode, length)
+                 for block, (_, typecode, length) in zip(blocks, descriptor)]
+        return CSRGraph(*views), blocks
+
+
+def _create_block(buffer):
+    data = memoryview(buffer).cast('B')
+    # Zero-sized blocks are not allowed, so an edgeless graph still gets one byte
+    block = shared_memory.SharedMemory(create=True, size=max(1, len(data)))
+    block.buf[:len(data)] = data
+    return block
+
+
+def _describe(block, typecode, length):
+    return block.name, typecode, length
+
+
+def _view(block, typecode, length):
+    itemsize = array(typecode).itemsize
+    return block.buf[:length * itemsize].cast(typecode)
+
+
+def _release(block):
+    block.close()
+    block.unlink()
+
+
+def _attach_worker(graph_descriptor, output_descriptor):
+    _worker['graph'], _worker['blocks'] = SharedCSR.attach(graph_descriptor)
+    if output_descriptor is not None:
+        name, typecode, length = output_descriptor
+        block = shared_memory.SharedMemory(name=name)
+        _worker['blocks'].append(block)
+        _worker['output'] = _view(block, typecode, length)
+
+
+def _solve_rows(bounds):
+    graph = _worker['graph']
+    return [dijkstra(graph, source) for source in range(*bounds)]
+
+
+def _fill_rows(bounds):
+    graph = _worker['graph']
+    output = _worker['output']
+    n = len(graph)
+    for source in range(*bounds):
+        output[source * n:(source + 1) * n] = array('d', dijkstra(graph, source))
+    return bounds
+
+
+def _restore(value, integral):
+    return int(value) if integral and value != INF else value
@@ -0,0 +1,49 @@
+from array import array
+from shortest_path.graph import index_typecode
+
+
+def predecessor_array(n):
+    # -1 marks nodes without a predecessor; the smallest signed type that fits n is used
+    return array(index_typecode(n), [-1]) * n
+
+
+def predecessor_path(predecessors, start, end):
+    # Walks the predecessor links back from end; None when end was not reached from start
+    path = [end]
+    while path[-1] != start:
+        previous = predecessors[path[-1]]
+        if previous == -1 or len(path) > len(predecessors):
+            return None
+        path.append(previous)
+    path.reverse()
+    return path
+
+
+class NextHopMatrix:
+    """
+    n x n table of first hops stored in one flat typed array: entry (i, j) is the
+    node that follows i on a shortest path from i to j, or -1 when j is unreachable.
+    Paths are only materialised when asked for.
+    """
+
+    def __init__(self, n, hops=None):
+        self.n = n
+        self.hops = hops if hops is not None else array(index_typecode(n), [-1]) * (n * n)
+
+    def __getitem__(self, pair):
+        i, j = pair
+        return self.hops[i * self.n + j]
+
+    def path(self, start, end):
+        if start == end:
+            return [start]
+        if self[start, end] == -1:
+            return None
+
+        path = [start]
+        while path[-1] != end:
+            path.append(self[path[-1], end])
+            if len(path) > self.n:
+                # Only possible when a negative cycle breaks the shortest path structure
+                return None
+        return path
@@ -0,0 +1,223 @@
+import math
+from collections import OrderedDict
+from shortest_path.algorithms import NegativeCycle, _reachable_from, dijkstra, spfa
+from shortest_path.all_pairs import _WithVirtualSource, _restore_distance, _reweight, blocked_floyd_warshall
+from shortest_path.batch import many_to_many
+from shortest_path.bidirectional import bidirectional_dijkstra
+from shortest_path.graph import CSRGraph, reverse_adjacency, typecode_of
+from shortest_path.queues import choose_queue
+
+# Seconds per unit of work, measured on the random graphs of data_generator:
+# one unit is an edge-log(n) step of a search, or one cell update of Floyd-Warshall
+DIJKSTRA_UNIT = 1e-8
+SPFA_UNIT = 2e-8
+FLOYD_WARSHALL_UNIT = 7e-8
+# Bucket queues replace the log(n) heap factor of a search with a small constant
+BUCKET_QUEUE_FACTOR = 4
+# Statistics are kept for this many graph objects
+STATS_CACHE_SIZE = 32
+
+_stats_cache = OrderedDict()
+
+
+class GraphStats:
+    """
+    What the planner needs to know about a graph, gathered in one pass over its
+    edges: size, density and the range and kind of its weights.
+    """
+
+    def __init__(self, graph):
+        n = len(graph)
+        if isinstance(graph, CSRGraph):
+            edges = graph.edge_count
+            low, high = graph.weight_range()
+            integral = typecode_of(graph.weights) != 'd'
+        else:
+            edges, low, high, integral = 0, None, None, True
+            for u in range(n):
+                for _, weight in graph[u]:
+                    edges += 1
+                    low = weight if low is None or weight < low else low
+                    high = weight if high is None or weight > high else high
+                    integral = integral and type(weight) is int
+
+        self.nodes = n
+        self.edges = edges
+        self.min_weight = low
+        self.max_weight = high
+        self.integral = integral
+        self.negative = low is not None and low < 0
+
+    @property
+    def density(self):
+        return self.edges / (self.nodes * self.nodes) if self.nodes else 0.0
+
+    def __repr__(self):
+        return (f"GraphStats(nodes={self.nodes}, edges={self.edges}, density={self.density:.3f}, "
+                f"weights=[{self.min_weight}, {self.max_weight}], integral={self.integral})")
+
+
+def graph_stats(graph, refresh=False):
+    # Cached per graph object; pass refresh=True after changing a graph in place
+    return _cache_entry(graph, refresh)[1]
+
+
+def _reverse(graph):
+    # Reversed graph for pair queries, built on the first one and kept with the stats
+    entry = _cache_entry(graph)
+    if entry[2] is None:
+        entry[2] = reverse_adjacency(graph)
+    return entry[2]
+
+
+def _cache_entry(graph, refresh=False):
+    # [graph, stats, reverse or None]
+    key = id(graph)
+    entry = _stats_cache.get(key)
+    if refresh or entry is None or entry[0] is not graph:
+        entry = [graph, GraphStats(graph), None]
+        _stats_cache[key] = entry
+        while len(_stats_cache) > STATS_CACHE_SIZE:
+            _stats_cache.popitem(last=False)
+    _stats_cache.move_to_end(key)
+    return entry
+
+
+class Plan:
+    """
+    The engine chosen for one query, with the estimated seconds of every engine
+    that could answer it correctly.
+    """
+
+    def __init__(self, engine, shape, estimates, stats, notes=()):
+        self.engine = engine
+        self.shape = shape
+        self.estimates = estimates
+        self.stats = stats
+        self.notes = list(notes)
+
+    def __str__(self):
+        lines = [f"{self.shape} query on {self.stats}"] + self.notes
+        for engine, seconds in sorted(self.estimates.items(), key=lambda item: item[1]):
+            marker = '->' if engine == self.engine else '  '
+            lines.append(f"{marker} {engine:<24} ~{seconds:.6f}s")
+        return "\n".join(lines)
+
+
+def plan(graph, sources=None, targets=None):
+    sources, targets = _listed(sources), _listed(targets)
+    stats = graph_stats(graph)
+    n = stats.nodes
+    shape = _shape(sources, targets)
+    source_count = 1 if shape in ('pair', 'single_source', 'one_to_many') else len(_nodes(sources, n))
+
+    notes = []
+    queue_factor = math.log2(n + 1)
+    if stats.negative:
+        notes.append("negative weights: plain Dijkstra would be wrong, so only SPFA, "
+                     "Johnson reweighting or Floyd-Warshall are considered")
+    elif choose_queue(graph) != 'heap':
+        notes.append(f"non-negative integer weights: searches use the {choose_queue(graph)} bucket queue")
+        queue_factor = BUCKET_QUEUE_FACTOR
+
+    search = DIJKSTRA_UNIT * (stats.edges + n) * queue_factor
+    potentials = SPFA_UNIT * (stats.edges + n) * math.log2(n + 1)
+    floyd_warshall = FLOYD_WARSHALL_UNIT * n ** 3
+
+    if not stats.negative:
+        if shape == 'pair':
+            estimates = {'bidirectional_dijkstra': search / 2}
+        elif shape in ('single_source', 'one_to_many'):
+            estimates = {'dijkstra': search}
+        else:
+            estimates = {'many_to_many': source_count * search, 'blocked_floyd_warshall': floyd_warshall}
+    elif source_count == 1:
+        estimates = {'spfa': potentials}
+    else:
+        estimates = {'johnson': potentials + source_count * search, 'blocked_floyd_warshall': floyd_warshall}
+
+    engine = min(estimates, key=estimates.get)
+    return Plan(engine, shape, estimates, stats, notes)
+
+
+def explain(graph, sources=None, targets=None):
+    return str(plan(graph, sources, targets))
+
+
+def shortest_path(graph, sources=None, targets=None):
+    # Front door over the engines. sources and targets are each a node, a list of
+    # nodes or None for every node; the result is a distance for a node pair, a list
+    # when one side is a single node, and a table with one row per source otherwise.
+    # A negative cycle is returned as NegativeCycle, like bellman_ford does.
+    sources, targets = _listed(sources), _listed(targets)
+    chosen = plan(graph, sources, targets)
+    n = chosen.stats.nodes
+    engine = chosen.engine
+
+    if chosen.shape == 'pair':
+        if engine == 'bidirectional_dijkstra':
+            return bidirectional_dijkstra(graph, sources, targets, reverse=_reverse(graph))
+        return spfa(graph, sources, targets)
+
+    if chosen.shape in ('single_source', 'one_to_many'):
+        row = dijkstra(graph, sources) if engine == 'dijkstra' else spfa(graph, sources)
+        if isinstance(row, NegativeCycle) or targets is None:
+            return row
+        return [row[target] for target in targets]
+
+    source_nodes, target_nodes = _nodes(sources, n), _nodes(targets, n)
+    if engine == 'many_to_many':
+        table = many_to_many(graph, source_nodes, target_nodes)
+    elif engine == 'spfa':
+        row = spfa(graph, source_nodes[0])
+        table = row if isinstance(row, NegativeCycle) else [[row[target] for target in target_nodes]]
+    elif engine == 'johnson':
+        table = _johnson_table(graph, source_nodes, target_nodes)
+    else:
+        table = _floyd_warshall_table(graph, source_nodes, target_nodes)
+
+    if isinstance(table, NegativeCycle) or chosen.shape == 'many_to_many':
+        return table
+    # Many sources to one target
+    return [row[0] for row in table]
+
+
+def _shape(sources, targets):
+    single_source, single_target = isinstance(sources, int), isinstance(targets, int)
+    if single_source and single_target:
+        return 'pair'
+    if single_source:
+        return 'single_source' if targets is None else 'one_to_many'
+    if single_target:
+        return 'many_to_one'
+    return 'many_to_many'
+
+
+def _listed(nodes):
+    # Iterables are read once here so planning and solving see the same nodes
+    return nodes if nodes is None or isinstance(nodes, int) else list(nodes)
+
+
+def _nodes(nodes, n):
+    if nodes is None:
+        return list(range(n))
+    if isinstance(nodes, int):
+        return [nodes]
+    return list(nodes)
+
+
+def _johnson_table(graph, sources, targets):
+    potentials = spfa(_WithVirtualSource(graph), len(graph))
+    if isinstance(potentials, NegativeCycle):
+        return potentials
+    table = many_to_many(_reweight(graph, potentials), sources, targets)
+    return [[_restore_distance(d, potentials, source, target) for target, d in zip(targets, row)]
+            for source, row in zip(sources, table)]
+
+
+def _floyd_warshall_table(graph, sources, targets):
+    matrix = blocked_floyd_warshall(graph)
+    on_cycle = [i for i in range(len(graph)) if matrix[i][i] < 0]
+    if on_cycle:
+        return NegativeCycle(_reachable_from(graph, on_cycle))
+    return [[matrix[source][target] for target in targets] for source in sources]
@@ -0,0 +1,117 @@
+from shortest_path.graph import CSRGraph, typecode_of
+
+INF = float('inf')
+# Dial keeps one bucket per possible weight, so it only pays off for small weights
+DIAL_MAX_WEIGHT = 4096
+
+
+def choose_queue(graph):
+    # Bucket queues need non-negative integer weights. Only a CSRGraph knows that
+    # without a full pass over its edges, so adjacency lists stay on the binary heap.
+    if not isinstance(graph, CSRGraph) or typecode_of(graph.weights) == 'd':
+        return 'heap'
+    low, high = graph.weight_range()
+    if low is None or low < 0:
+        return 'heap'
+    return 'dial' if high <= DIAL_MAX_WEIGHT else 'radix'
+
+
+def max_weight(graph):
+    if isinstance(graph, CSRGraph):
+        return graph.weight_range()[1] or 0
+    return max((weight for u in range(len(graph)) for _, weight in graph[u]), default=0)
+
+
+def dial_dijkstra(graph, start, end=None, predecessors=None):
+    # Circular array of max_weight + 1 buckets: every tentative distance lies in
+    # [current, current + max_weight], so each bucket holds exactly one distance value
+    n = len(graph)
+    distances = [INF] * n
+    distances[start] = 0
+    size = max_weight(graph) + 1
+    buckets = [[] for _ in range(size)]
+    buckets[0].append(start)
+    pending = 1
+    current = 0
+
+    while pending:
+        bucket = buckets[current % size]
+        while bucket:
+            node = bucket.pop()
+            pending -= 1
+            if distances[node] != current:
+                continue
+            if node == end:
+                return current
+
+            for neighbor, weight in graph[node]:
+                new_dist = current + weight
+                if new_dist < distances[neighbor]:
+                    distances[neighbor] = new_dist
+                    if predecessors is not None:
+                        predecessors[neighbor] = node
+                    buckets[new_dist % size].append(neighbor)
+                    pending += 1
+        current += 1
+
+    return distances[end] if end is not None else distances
+
+
+def radix_dijkstra(graph, start, end=None, predecessors=None):
+    n = len(graph)
+    distances = [INF] * n
+    distances[start] = 0
+    heap = RadixHeap()
+    heap.push(0, start)
+
+    while heap:
+        current_dist, current_node = heap.pop()
+        if current_dist > distances[current_node]:
+            continue
+        if current_node == end:
+            return current_dist
+
+        for neighbor, weight in graph[current_node]:
+            new_dist = current_dist + weight
+            if new_dist < distances[neighbor]:
+                distances[neighbor] = new_dist
+                if predecessors is not None:
+                    predecessors[neighbor] = current_node
+                heap.push(new_dist, neighbor)
+
+    return distances[end] if end is not None else distances
+
+
+class RadixHeap:
+    """
+    Monotone priority queue for non-negative integer keys: a pushed key may never be
+    smaller than the last popped one, which always holds for Dijkstra. Bucket i holds
+    keys whose highest bit differing from the last popped key is bit i - 1.
+    """
+
+    def __init__(self):
+        self.last = 0
+        self.size = 0
+        self.buckets = [[] for _ in range(65)]
+
+    def __len__(self):
+        return self.size
+
+    def push(self, key, value):
+        self.buckets[(key ^ self.last).bit_length()].append((key, value))
+        self.size += 1
+
+    def pop(self):
+        if not self.buckets[0]:
+            i = 1
+            while not self.buckets[i]:
+                i += 1
+            # Moving to the smallest key of the first non-empty bucket spreads it strictly lower
+            entries = self.buckets[i]
+            self.buckets[i] = []
+            self.last = min(entries)[0]
+            for entry in entries:
+                self.buckets[(entry[0] ^ self.last).bit_length()].append(entry)
+
+        self.size -= 1
+        return self.buckets[0].pop()
@@ -0,0 +1,123 @@
+from array import array
+from shortest_path.graph import index_typecode
+
+# Above this many components the transitive closure bitsets would take too much memory
+CLOSURE_LIMIT = 20000
+
+
+class ReachabilityIndex:
+    """
+    Strongly connected components of a graph and their condensation DAG.
+
+    Components are numbered by Tarjan's algorithm in reverse topological order, so a
+    component can only reach components with a smaller id. Queries inside one
+    component or against that order are answered in O(1). Graphs with up to
+    CLOSURE_LIMIT components also get transitive-closure bitsets, making every query
+    O(1); larger ones fall back to a pruned search of the condensation.
+    """
+
+    def __init__(self, components, successors, closure=None):
+        self.components = components
+        self.successors = successors
+        self.closure = closure
+
+    @classmethod
+    def build(cls, graph, closure_limit=CLOSURE_LIMIT):
+        components, count = strongly_connected_components(graph)
+
+        successors = [set() for _ in range(count)]
+        for u in range(len(graph)):
+            cu = components[u]
+            for v, _ in graph[u]:
+                if components[v] != cu:
+                    successors[cu].add(components[v])
+        successors = [tuple(s) for s in successors]
+
+        closure = None
+        if count <= closure_limit:
+            # Successors always have smaller ids, so they are finished first
+            closure = []
+            for c in range(count):
+                reach = 1 << c
+                for d in successors[c]:
+                    reach |= closure[d]
+                closure.append(reach)
+
+        return cls(components, successors, closure)
+
+    @property
+    def component_count(self):
+        return len(self.successors)
+
+    def reachable(self, u, v):
+        cu, cv = self.components[u], self.components[v]
+        if cu == cv:
+            return True
+        if cu < cv:
+            return False
+        if self.closure is not None:
+            return self.closure[cu] >> cv & 1 == 1
+
+        stack = [cu]
+        seen = {cu}
+        while stack:
+            for d in self.successors[stack.pop()]:
+                if d == cv:
+                    return True
+                if d > cv and d not in seen:
+                    seen.add(d)
+                    stack.append(d)
+        return False
+
+
+def strongly_connected_components(graph):
+    # Iterative Tarjan, O(V + E); returns (component id per node, number of components)
+    n = len(graph)
+    index = [-1] * n
+    low = [0] * n
+    on_stack = [False] * n
+    stack = []
+    components = array(index_typecode(n), [-1]) * n
+    count = 0
+    counter = 0
+
+    for root in range(n):
+        if index[root] != -1:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        work = [(root, iter(graph[root]))]
+
+        while work:
+            node, edges = work[-1]
+            descended = False
+            for v, _ in edges:
+                if index[v] == -1:
+                    index[v] = low[v] = counter
+                    counter += 1
+                    stack.append(v)
+                    on_stack[v] = True
+                    work.append((v, iter(graph[v])))
+                    descended = True
+                    break
+                if on_stack[v] and index[v] < low[node]:
+                    low[node] = index[v]
+            if descended:
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[node])
+            if low[node] == index[node]:
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = False
+                    components[member] = count
+                    if member == node:
+                        break
+                count += 1
+
+    return components, count
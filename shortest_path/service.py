@@ -0,0 +1,206 @@
+import asyncio
+import json
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from shortest_path.algorithms import NegativeCycle, bellman_ford, dijkstra
+from shortest_path.graph import CSRGraph
+from shortest_path.graph_io import load_graph
+from shortest_path.paths import predecessor_path
+
+INF = float('inf')
+DEFAULT_CACHE_SIZE = 4096
+# Latencies kept for the percentiles
+LATENCY_WINDOW = 10000
+
+# Set in every worker process by _attach_worker
+_worker = {}
+
+
+class ShortestPathService:
+    """
+    Answers distance and path queries against one graph. Queries from a source whose
+    search is already running wait for that search instead of starting another, and
+    answers are kept in an LRU cache keyed by (source, target) that is dropped whenever
+    the graph is replaced. Searches run on a process pool (or a thread pool with
+    threads=True), so the event loop stays free to accept requests.
+
+    `graph` is a graph object or the path of a file written by graph_io.save_graph;
+    process workers load a file themselves instead of receiving a pickled graph.
+    """
+
+    def __init__(self, graph, workers=None, cache_size=DEFAULT_CACHE_SIZE, threads=False):
+        self.workers = workers
+        self.cache_size = cache_size
+        self.threads = threads
+        self.version = 0
+        self.cache = OrderedDict()
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+        self.counters = {'queries': 0, 'hits': 0, 'misses': 0, 'coalesced': 0, 'searches': 0}
+        self._pending = {}
+        self._connections = set()
+        self._executor = None
+        self.set_graph(graph)
+
+    def set_graph(self, graph):
+        # Installs a new graph version; cached answers and running searches of the
+        # old version are discarded
+        self.version += 1
+        self.cache.clear()
+        self._pending.clear()
+        self.graph = load_graph(graph) if isinstance(graph, str) else graph
+        self._search = bellman_ford if _has_negative_weights(self.graph) else dijkstra
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+        if self.threads:
+            self._executor = ThreadPoolExecutor(self.workers)
+        else:
+            self._executor = ProcessPoolExecutor(self.workers, initializer=_attach_worker,
+                                                 initargs=(graph, self._search))
+
+    def close(self):
+        self._executor.shutdown()
+
+    async def query(self, source, target, return_path=False):
+        # Returns the distance, or (distance, path) with return_path=True
+        t_start = time.perf_counter()
+        self.counters['queries'] += 1
+        key = (source, target)
+
+        if key in self.cache:
+            self.counters['hits'] += 1
+            self.cache.move_to_end(key)
+            answer = self.cache[key]
+        else:
+            self.counters['misses'] += 1
+            version = self.version
+            distances, predecessors = await self._single_source(source)
+            if isinstance(distances, NegativeCycle):
+                answer = (distances, None)
+            else:
+                answer = (distances[target], predecessor_path(predecessors, source, target))
+            if version == self.version:
+                self._remember(key, answer)
+
+        self.latencies.append(time.perf_counter() - t_start)
+        return answer if return_path else answer[0]
+
+    async def _single_source(self, source):
+        key = (self.version, source)
+        future = self._pending.get(key)
+        if future is not None:
+            self.counters['coalesced'] += 1
+            return await asyncio.shield(future)
+
+        self.counters['searches'] += 1
+        loop = asyncio.get_running_loop()
+        if self.threads:
+            future = loop.run_in_executor(self._executor, _search_graph, self.graph, self._search, source)
+        else:
+            future = loop.run_in_executor(self._executor, _search_worker, source)
+        self._pending[key] = future
+        try:
+            return await asyncio.shield(future)
+        finally:
+            if self._pending.get(key) is future:
+                del self._pending[key]
+
+    def _remember(self, key, answer):
+        self.cache[key] = answer
+        self.cache.move_to_end(key)
+        while len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+
+    def stats(self):
+        latencies = sorted(self.latencies)
+        lookups = self.counters['hits'] + self.counters['misses']
+        return {
+            'version': self.version,
+            'cache_entries': len(self.cache),
+            'hit_rate': self.counters['hits'] / lookups if lookups else 0.0,
+            'latency': {f'p{p}': _percentile(latencies, p) for p in (50, 90, 99)},
+            **self.counters,
+        }
+
+    async def serve(self, host='127.0.0.1', port=8765):
+        return await asyncio.start_server(self.handle, host, port)
+
+    async def wait_connections(self):
+        # Waits until every connection handler has returned; server.wait_closed() does
+        # not wait for them on Python 3.11
+        await asyncio.gather(*self._connections, return_exceptions=True)
+
+    async def handle(self, reader, writer):
+        # One JSON object per line in each direction:
+        #   {"op": "distance" | "path", "source": s, "target": t}
+        #   {"op": "stats"}
+        #   {"op": "reload", "graph": "<path of a graph file>"}
+        task = asyncio.current_task()
+        self._connections.add(task)
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    response = await self._respond(json.loads(line))
+                except (ValueError, KeyError, TypeError, IndexError, OSError) as error:
+                    response = {'error': str(error)}
+                writer.write(json.dumps(response).encode() + b'\n')
+                await writer.drain()
+        except (asyncio.CancelledError, ConnectionResetError):
+            # The client went away or the server is shutting down; nothing to answer
+            pass
+        finally:
+            self._connections.discard(task)
+            writer.close()
+
+    async def _respond(self, request):
+        op = request['op']
+        if op in ('distance', 'path'):
+            source, target = int(request['source']), int(request['target'])
+            if not (0 <= source < len(self.graph) and 0 <= target < len(self.graph)):
+                raise IndexError(f"Node out of range: {source}, {target}")
+            distance, path = await self.query(source, target, return_path=True)
+            if isinstance(distance, NegativeCycle):
+                return {'error': str(distance)}
+            response = {'distance': None if distance == INF else distance}
+            if op == 'path':
+                response['path'] = path
+            return response
+        if op == 'stats':
+            return self.stats()
+        if op == 'reload':
+            self.set_graph(request['graph'])
+            return {'version': self.version}
+        raise ValueError(f"Unknown op: {op}")
+
+
+def _attach_worker(graph, search):
+    _worker['graph'] = load_graph(graph) if isinstance(graph, str) else graph
+    _worker['search'] = search
+
+
+def _search_worker(source):
+    return _search_graph(_worker['graph'], _worker['search'], source)
+
+
+def _search_graph(graph, search, source):
+    result = search(graph, source, predecessors=True)
+    if isinstance(result, NegativeCycle):
+        return result, None
+    return result
+
+
+def _has_negative_weights(graph):
+    if isinstance(graph, CSRGraph):
+        low = graph.weight_range()[0]
+        return low is not None and low < 0
+    return any(weight < 0 for u in range(len(graph)) for _, weight in graph[u])
+
+
+def _percentile(values, p):
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(len(values) * p / 100))]
@@ -0,0 +1,124 @@
+import heapq
+from shortest_path.algorithms import NegativeCycle, _reachable_from
+from shortest_path.paths import predecessor_array, predecessor_path
+
+INF = float('inf')
+
+
+class ShortestPathSolver:
+    """
+    Runs many queries against one graph while reusing its distance, predecessor and
+    heap buffers. Only the entries a query touched are reset before the next one, so
+    a query that stays local costs time proportional to the nodes it reaches, not n.
+
+    Results of the last query stay readable (distances, path) until the next query.
+    """
+
+    def __init__(self, graph):
+        self.graph = graph
+        n = len(graph)
+        self.distances = [INF] * n
+        self.predecessors = predecessor_array(n)
+        self._touched = []
+        self._heap = []
+        self._start = None
+
+    def _reset(self, start):
+        distances = self.distances
+        predecessors = self.predecessors
+        for node in self._touched:
+            distances[node] = INF
+            predecessors[node] = -1
+        self._touched.clear()
+        self._heap.clear()
+
+        distances[start] = 0
+        self._touched.append(start)
+        self._start = start
+
+    def dijkstra(self, start, end=None):
+        self._reset(start)
+        graph = self.graph
+        distances = self.distances
+        predecessors = self.predecessors
+        touched = self._touched
+        heap = self._heap
+        heap.append((0, start))
+
+        while heap:
+            current_dist, current_node = heapq.heappop(heap)
+            if current_node == end:
+                break
+            if current_dist > distances[current_node]:
+                continue
+
+            for neighbor, weight in graph[current_node]:
+                new_dist = current_dist + weight
+                if new_dist < distances[neighbor]:
+                    if distances[neighbor] == INF:
+                        touched.append(neighbor)
+                    distances[neighbor] = new_dist
+                    predecessors[neighbor] = current_node
+                    heapq.heappush(heap, (new_dist, neighbor))
+
+        return distances[end] if end is not None else list(distances)
+
+    def distances_to(self, start, targets):
+        # Dijkstra that stops once every target is settled; distances in targets order
+        self._reset(start)
+        graph = self.graph
+        distances = self.distances
+        predecessors = self.predecessors
+        touched = self._touched
+        heap = self._heap
+        heap.append((0, start))
+        remaining = set(targets)
+
+        while heap and remaining:
+            current_dist, current_node = heapq.heappop(heap)
+            if current_dist > distances[current_node]:
+                continue
+            remaining.discard(current_node)
+
+            for neighbor, weight in graph[current_node]:
+                new_dist = current_dist + weight
+                if new_dist < distances[neighbor]:
+                    if distances[neighbor] == INF:
+                        touched.append(neighbor)
+                    distances[neighbor] = new_dist
+                    predecessors[neighbor] = current_node
+                    heapq.heappush(heap, (new_dist, neighbor))
+
+        return [distances[target] for target in targets]
+
+    def bellman_ford(self, start, end=None):
+        # Passes only visit nodes with a finite distance, which are exactly the touched ones
+        self._reset(start)
+        graph = self.graph
+        distances = self.distances
+        predecessors = self.predecessors
+        touched = self._touched
+
+        for _ in range(len(graph) - 1):
+            changed = False
+            for u in touched:
+                dist_u = distances[u]
+                for v, weight in graph[u]:
+                    if dist_u + weight < distances[v]:
+                        if distances[v] == INF:
+                            touched.append(v)
+                        distances[v] = dist_u + weight
+                        predecessors[v] = u
+                        changed = True
+            if not changed:
+                break
+
+        improvable = [v for u in touched for v, weight in graph[u] if distances[u] + weight < distances[v]]
+        if improvable:
+            return NegativeCycle(_reachable_from(graph, improvable))
+
+        return distances[end] if end is not None else list(distances)
+
+    def path(self, end):
+        # Route from the last query's start to end, or None if end was not reached
+        return predecessor_path(self.predecessors, self._start, end)
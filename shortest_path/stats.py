@@ -0,0 +1,36 @@
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+
+class Stats:
+    # Collects operation counters, per-iteration series and per-phase timings from the
+    # algorithms that accept `stats=`. Passing None (the default) runs the uninstrumented
+    # loops, so turning stats off costs a single comparison per call.
+    # hook(phase, seconds), when given, is called as each phase finishes.
+    def __init__(self, hook=None):
+        self.counters = defaultdict(int)
+        self.series = defaultdict(list)
+        self.timings = defaultdict(float)
+        self.hook = hook
+
+    @contextmanager
+    def phase(self, name):
+        t_start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - t_start
+            self.timings[name] += elapsed
+            if self.hook is not None:
+                self.hook(name, elapsed)
+
+    def as_dict(self):
+        return {
+            "counters": dict(self.counters),
+            "series": {name: list(values) for name, values in self.series.items()},
+            "timings": dict(self.timings),
+        }
+
+    def __repr__(self):
+        return f"Stats(counters={dict(self.counters)}, timings={dict(self.timings)})"
@@ -1,4 +1,6 @@
+import random
 import unittest
+from data import data_generator
 from shortest_path import algorithms
 
 
@@ -86,6 +88,36 @@ class TestShortestPaths(unittest.TestCase):
         fw_matrix = algorithms.floyd_warshall(self.graph_bellman)
         self.assertEqual(fw_matrix[0][2], -1)
 
+    def test_bellman_ford_reports_cycle_nodes(self):
+        # Nodes 0-2 form the cycle and node 3 hangs off it; node 4 is unaffected
+        graph = [[(1, 1)], [(2, -1)], [(0, -1), (3, 5)], [], [(0, 1)]]
+        result = algorithms.bellman_ford(graph, 0)
+        self.assertEqual(result.nodes, {0, 1, 2, 3})
+
+    def test_spfa_matches_bellman_ford(self):
+        self.assertEqual(algorithms.spfa(self.graph_bellman, 0, 2), -1)
+        self.assertEqual(algorithms.spfa(self.graph_dijkstra, 0), algorithms.bellman_ford(self.graph_dijkstra, 0))
+        self.assertEqual(algorithms.spfa(self.graph_dijkstra, 4, 0), float('inf'))
+
+        random.seed(3)
+        for _ in range(10):
+            graph, start, goal, _ = data_generator.get_random_graph(25)
+            # Only forward edges, so negative weights cannot form a cycle
+            dag = [[(v, w - 50) for v, w in edges if v > u] for u, edges in enumerate(graph)]
+            for g in (graph, dag):
+                self.assertEqual(algorithms.spfa(g, start), algorithms.bellman_ford(g, start))
+                self.assertEqual(algorithms.spfa(g, start, goal), algorithms.bellman_ford(g, start, goal))
+
+    def test_spfa_detects_cycle(self):
+        result = algorithms.spfa(self.graph_bellman_cycle, 0)
+        self.assertEqual(result, "Negative cycle detected")
+        self.assertEqual(result.nodes, {0, 1, 2})
+
+        # A cycle that cannot reach the target does not affect its distance
+        graph = [[(1, 2), (3, 1)], [(2, -5)], [(1, 1)], []]
+        self.assertEqual(algorithms.spfa(graph, 0, 3), 1)
+        self.assertEqual(algorithms.spfa(graph, 0).nodes, {1, 2})
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
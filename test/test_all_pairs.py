@@ -0,0 +1,71 @@
+import random
+import unittest
+from data import data_generator
+from shortest_path import algorithms, all_pairs
+from shortest_path.graph import CSRGraph
+
+
+class TestBlockedFloydWarshall(unittest.TestCase):
+    def setUp(self):
+        # Graph with negative weights but no negative cycle
+        self.graph_negative = [
+            [(1, 4), (2, -1)],
+            [(2, -2)],
+            []
+        ]
+
+    def test_single_pair(self):
+        result = all_pairs.blocked_floyd_warshall(self.graph_negative, 0, 2)
+        self.assertEqual(result, -1)
+
+    def test_matches_floyd_warshall(self):
+        # Block sizes that do and do not divide n must agree with the reference
+        random.seed(11)
+        for size, block_size in [(1, 4), (17, 4), (40, 7), (40, 64)]:
+            graph = data_generator.get_random_graph(size)[0]
+            expected = algorithms.floyd_warshall(graph)
+            self.assertEqual(all_pairs.blocked_floyd_warshall(graph, block_size=block_size), expected)
+
+    def test_negative_edges(self):
+        random.seed(5)
+        graph = data_generator.get_random_graph(30)[0]
+        # Only forward edges, so negative weights cannot form a cycle
+        dag = [[(v, w - 50) for v, w in edges if v > u] for u, edges in enumerate(graph)]
+        expected = algorithms.floyd_warshall(dag)
+        self.assertEqual(all_pairs.blocked_floyd_warshall(dag, block_size=8), expected)
+        self.assertEqual(all_pairs.blocked_floyd_warshall(CSRGraph.from_adjacency(dag), block_size=8), expected)
+
+    def test_integer_results_stay_integers(self):
+        matrix = all_pairs.blocked_floyd_warshall(self.graph_negative)
+        self.assertIsInstance(matrix[0][1], int)
+        self.assertEqual(matrix[2][0], float('inf'))
+
+
+class TestJohnson(unittest.TestCase):
+    def test_matches_floyd_warshall(self):
+        random.seed(13)
+        for _ in range(5):
+            graph = data_generator.get_random_graph(30)[0]
+            dag = [[(v, w - 50) for v, w in edges if v > u] for u, edges in enumerate(graph)]
+            for g in (graph, dag, CSRGraph.from_adjacency(dag)):
+                self.assertEqual(all_pairs.johnson(g), algorithms.floyd_warshall(g))
+
+    def test_single_pair(self):
+        graph = [[(1, 4), (2, -1)], [(2, -2)], []]
+        self.assertEqual(all_pairs.johnson(graph, 0, 2), -1)
+        self.assertEqual(all_pairs.johnson(graph, 2, 0), float('inf'))
+
+    def test_stream_yields_rows_in_source_order(self):
+        graph = [[(1, 4), (2, -1)], [(2, -2)], []]
+        rows = all_pairs.johnson(graph, stream=True)
+        self.assertEqual(next(rows), [0, 4, -1])
+        self.assertEqual(list(rows), [[float('inf'), 0, -2], [float('inf'), float('inf'), 0]])
+
+    def test_negative_cycle(self):
+        result = all_pairs.johnson([[(1, 1)], [(2, -1)], [(0, -1)]])
+        self.assertEqual(result, "Negative cycle detected")
+        self.assertEqual(result.nodes, {0, 1, 2})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+import random
+import unittest
+from data import data_generator
+from shortest_path import algorithms
+from shortest_path.batch import many_to_many, one_to_many
+from shortest_path.contraction import ContractionHierarchy
+from shortest_path.graph import CSRGraph
+
+
+class TestBatchedQueries(unittest.TestCase):
+    def setUp(self):
+        random.seed(53)
+        self.graph = data_generator.get_random_graph(50)[0]
+        self.sources = random.sample(range(50), 6)
+        self.targets = random.sample(range(50), 15)
+        self.expected = [[algorithms.dijkstra(self.graph, s, t) for t in self.targets] for s in self.sources]
+
+    def test_independent_searches(self):
+        self.assertEqual(many_to_many(self.graph, self.sources, self.targets), self.expected)
+        csr = CSRGraph.from_adjacency(self.graph)
+        self.assertEqual(many_to_many(csr, self.sources, iter(self.targets)), self.expected)
+
+    def test_bucket_many_to_many(self):
+        hierarchy = ContractionHierarchy.build(self.graph)
+        result = many_to_many(self.graph, self.sources, self.targets, hierarchy=hierarchy)
+        self.assertEqual(result, self.expected)
+
+    def test_one_to_many_with_unreachable_targets(self):
+        graph = [[(1, 3), (2, 1)], [], [(1, 1)], []]
+        self.assertEqual(one_to_many(graph, 0, [3, 1, 0]), [float('inf'), 2, 0])
+        hierarchy = ContractionHierarchy.build(graph)
+        self.assertEqual(many_to_many(graph, [0, 3], [1, 3], hierarchy=hierarchy),
+                         [[2, float('inf')], [float('inf'), 0]])
+
+
+if __name__ == '__main__':
+    unittest.main()
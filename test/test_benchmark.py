@@ -0,0 +1,67 @@
+import contextlib
+import json
+import os
+import tempfile
+import unittest
+from data import benchmark
+
+
+class TestBenchmark(unittest.TestCase):
+    def test_run_benchmark(self):
+        results = benchmark.run_benchmark(["dijkstra", "spfa"], sizes=[5, 8], samples=2, warmup=1, repeat=3)
+        self.assertEqual(results["meta"]["repeat"], 3)
+        self.assertEqual([(r["case"], r["size"]) for r in results["results"]],
+                         [("dijkstra", 5), ("spfa", 5), ("dijkstra", 8), ("spfa", 8)])
+        for r in results["results"]:
+            self.assertEqual(len(r["times"]), 6)
+            self.assertEqual(len(r["peak_memory"]), 2)
+        # Results must be plain JSON
+        json.dumps(results)
+
+    def test_parallel_case_needs_large_graphs(self):
+        results = benchmark.run_benchmark(["delta_stepping", "delta_stepping_parallel"], sizes=[8],
+                                          samples=1, warmup=0, repeat=1)
+        self.assertEqual([r["case"] for r in results["results"]], ["delta_stepping"])
+
+    def test_update_benchmark(self):
+        results = benchmark.run_update_benchmark(sizes=[8], updates=10)
+        self.assertEqual(results[0]["size"], 8)
+        for name in ("all_pairs", "single_source"):
+            self.assertGreater(results[0][name]["incremental_per_second"], 0)
+            self.assertGreater(results[0][name]["recompute_per_second"], 0)
+
+    def test_oracle_benchmark(self):
+        rows = benchmark.run_oracle_benchmark(sizes=[200], ks=[2], sources=3, targets=5)
+        self.assertEqual((rows[0]["size"], rows[0]["k"]), (200, 2))
+        self.assertLessEqual(rows[0]["max_stretch"], rows[0]["stretch_bound"])
+        self.assertGreater(rows[0]["entries"], 0)
+
+    def test_compare_flags_regressions(self):
+        baseline = {"results": [{"case": "dijkstra", "size": 10, "times": [1.0, 1.1, 0.9, 1.0, 1.05]},
+                                {"case": "spfa", "size": 10, "times": [1.0, 1.1, 0.9, 1.0, 1.05]}]}
+        current = {"results": [{"case": "dijkstra", "size": 10, "times": [2.0, 2.1, 1.9, 2.0, 2.05]},
+                               {"case": "spfa", "size": 10, "times": [1.0, 1.2, 0.9, 1.0, 1.0]}]}
+        report = {row["case"]: row for row in benchmark.compare(baseline, current)}
+        self.assertTrue(report["dijkstra"]["regression"])
+        self.assertAlmostEqual(report["dijkstra"]["change"], 0.99, places=2)
+        self.assertFalse(report["spfa"]["significant"])
+        self.assertFalse(report["spfa"]["regression"])
+
+    def test_measure_separates_time_and_memory(self):
+        result, elapsed, peak = benchmark.measure(lambda n: [0] * n, 10000)
+        self.assertEqual(len(result), 10000)
+        self.assertGreater(elapsed, 0)
+        self.assertGreaterEqual(peak, 80000)
+
+    def test_command_line(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "results.json")
+            code = benchmark.main(["run", "--cases", "dijkstra", "--sizes", "5", "--samples", "1",
+                                   "--repeat", "2", "--out", path])
+            self.assertEqual(code, 0)
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                self.assertEqual(benchmark.main(["compare", path, path]), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
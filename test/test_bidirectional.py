@@ -0,0 +1,64 @@
+import random
+import unittest
+from data import data_generator
+from shortest_path import algorithms
+from shortest_path.bidirectional import bidirectional_dijkstra
+from shortest_path.graph import CSRGraph, reverse_adjacency
+
+
+class TestBidirectionalDijkstra(unittest.TestCase):
+    def setUp(self):
+        self.graph = [
+            [(1, 3), (2, 1), (3, 10)],
+            [(4, 2)],
+            [(4, 4)],
+            [(4, 1)],
+            []
+        ]
+
+    def path_length(self, graph, path):
+        weights = {(u, v): w for u in range(len(graph)) for v, w in graph[u]}
+        return sum(weights[(u, v)] for u, v in zip(path, path[1:]))
+
+    def test_distance_and_path(self):
+        self.assertEqual(bidirectional_dijkstra(self.graph, 0, 4), 5)
+        self.assertEqual(bidirectional_dijkstra(self.graph, 0, 4, return_path=True), (5, [0, 1, 4]))
+        self.assertEqual(bidirectional_dijkstra(self.graph, 2, 2, return_path=True), (0, [2]))
+
+    def test_no_path(self):
+        self.assertEqual(bidirectional_dijkstra(self.graph, 4, 0), float('inf'))
+        self.assertEqual(bidirectional_dijkstra(self.graph, 4, 0, return_path=True), (float('inf'), None))
+
+    def test_matches_dijkstra(self):
+        random.seed(17)
+        for _ in range(10):
+            graph, start, goal, _ = data_generator.get_random_graph(40)
+            csr = CSRGraph.from_adjacency(graph)
+            reverse = reverse_adjacency(graph)
+            for end in range(len(graph)):
+                expected = algorithms.dijkstra(graph, start, end)
+                self.assertEqual(bidirectional_dijkstra(graph, start, end, reverse=reverse), expected)
+                distance, path = bidirectional_dijkstra(csr, start, end, return_path=True)
+                self.assertEqual(distance, expected)
+                if path is not None:
+                    self.assertEqual((path[0], path[-1]), (start, end))
+                    self.assertEqual(self.path_length(graph, path), expected)
+
+    def test_csr_reverse_is_cached(self):
+        csr = CSRGraph.from_adjacency(self.graph)
+        self.assertIs(csr.reverse(), csr.reverse())
+        self.assertIs(csr.reverse().reverse(), csr)
+        self.assertEqual(csr.reverse().to_adjacency(), reverse_adjacency(self.graph))
+
+    def test_list_edits_are_seen(self):
+        # Adjacency lists are reversed per call, so an in-place edit is never stale
+        graph = [[(1, 1)], [], []]
+        self.assertEqual(algorithms.spfa(graph, 0, 2), float('inf'))
+        self.assertEqual(bidirectional_dijkstra(graph, 0, 2), float('inf'))
+        graph[1].append((2, 1))
+        self.assertEqual(algorithms.spfa(graph, 0, 2), 2)
+        self.assertEqual(bidirectional_dijkstra(graph, 0, 2), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
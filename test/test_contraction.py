@@ -0,0 +1,59 @@
+import random
+import unittest
+from data import data_generator
+from shortest_path import algorithms
+from shortest_path.contraction import ContractionHierarchy
+from shortest_path.graph import CSRGraph
+
+
+class TestContractionHierarchy(unittest.TestCase):
+    def path_length(self, graph, path):
+        weights = {}
+        for u in range(len(graph)):
+            for v, w in graph[u]:
+                weights[(u, v)] = min(w, weights.get((u, v), float('inf')))
+        return sum(weights[(u, v)] for u, v in zip(path, path[1:]))
+
+    def test_matches_dijkstra_on_random_graphs(self):
+        random.seed(23)
+        for size in (10, 35, 60):
+            graph = data_generator.get_random_graph(size)[0]
+            hierarchy = ContractionHierarchy.build(graph)
+            for start in range(size):
+                expected = algorithms.dijkstra(graph, start)
+                for end in range(size):
+                    self.assertEqual(hierarchy.query(start, end), expected[end])
+
+    def test_paths_are_unpacked(self):
+        random.seed(29)
+        graph = data_generator.get_random_graph(40)[0]
+        hierarchy = ContractionHierarchy.build(CSRGraph.from_adjacency(graph))
+        for start in range(0, 40, 3):
+            for end in range(40):
+                distance, path = hierarchy.query(start, end, return_path=True)
+                if distance == float('inf'):
+                    self.assertIsNone(path)
+                    continue
+                self.assertEqual((path[0], path[-1]), (start, end))
+                self.assertEqual(self.path_length(graph, path), distance)
+
+    def test_shortcut_on_a_line(self):
+        # Contracting the middle of a chain must keep the end-to-end distance
+        graph = [[(1, 2)], [(2, 3)], [(3, 4)], []]
+        hierarchy = ContractionHierarchy.build(graph)
+        self.assertEqual(hierarchy.query(0, 3, return_path=True), (9, [0, 1, 2, 3]))
+        self.assertEqual(hierarchy.query(3, 0), float('inf'))
+
+    def test_report(self):
+        graph = data_generator.get_random_graph(20)[0]
+        report = ContractionHierarchy.build(graph).report
+        self.assertEqual(report['nodes'], 20)
+        self.assertEqual(report['original_edges'], sum(len(edges) for edges in graph))
+        self.assertGreaterEqual(report['build_seconds'], 0)
+        # A shortcut may replace a longer original edge between the same nodes
+        self.assertLessEqual(report['upward_edges'] + report['downward_edges'],
+                             report['original_edges'] + report['shortcuts'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,7 @@
 import random
 import unittest
 from data import data_generator
+from shortest_path.graph import CSRGraph
 
 class TestGraphGenerator(unittest.TestCase):
     def test_valid_sizes(self):
@@ -72,6 +73,39 @@ class TestGraphGenerator(unittest.TestCase):
                 neighbor, weight = edge
                 self.assertTrue(isinstance(neighbor, int))
                 self.assertTrue(isinstance(weight, int))
+    def test_large_graph_families(self):
+        """Test that every family builds a CSR graph with a start-goal path."""
+        for family in ("uniform", "grid", "power_law"):
+            graph, start, goal, edge_count = data_generator.get_large_random_graph(
+                500, average_degree=3, family=family, seed=1)
+            self.assertIsInstance(graph, CSRGraph)
+            self.assertEqual(len(graph), 500)
+            self.assertEqual(graph.edge_count, edge_count)
+            self.assertNotEqual(start, goal)
+            self.assertTrue(data_generator.has_path(graph, start, goal))
+            for u, v, weight in graph.edges():
+                self.assertNotEqual(u, v)
+                self.assertTrue(0 <= v < 500)
+                self.assertTrue(1 <= weight <= 100)
+
+    def test_large_graph_is_reproducible(self):
+        """Test that the same seed gives the same graph and endpoints."""
+        first = data_generator.get_large_random_graph(300, density=0.02, seed=5)
+        second = data_generator.get_large_random_graph(300, density=0.02, seed=5)
+        self.assertEqual(first[0].to_adjacency(), second[0].to_adjacency())
+        self.assertEqual(first[1:], second[1:])
+        # density 0.02 on 300 nodes means about 6 edges per node
+        self.assertTrue(900 < first[3] < 2700)
+
+    def test_large_graph_edge_cases(self):
+        """Test empty and tiny graphs and unknown families."""
+        graph, start, goal, edge_count = data_generator.get_large_random_graph(0)
+        self.assertEqual((len(graph), start, goal, edge_count), (0, -1, -1, 0))
+        graph, start, goal, _ = data_generator.get_large_random_graph(2, seed=3)
+        self.assertTrue(data_generator.has_path(graph, start, goal))
+        with self.assertRaises(ValueError):
+            data_generator.get_large_random_graph(10, family="complete")
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,41 @@
+import random
+import unittest
+from unittest import mock
+from data import data_generator
+from shortest_path import algorithms, delta_stepping
+from shortest_path.graph import CSRGraph
+
+
+class TestDeltaStepping(unittest.TestCase):
+    def test_matches_dijkstra(self):
+        random.seed(19)
+        for size in (1, 10, 60):
+            graph, start, goal, _ = data_generator.get_random_graph(size)
+            expected = algorithms.dijkstra(graph, start)
+            for delta in (None, 1, 7, 1000):
+                self.assertEqual(delta_stepping.delta_stepping(graph, start, delta=delta), expected)
+            self.assertEqual(delta_stepping.delta_stepping(graph, start, goal), expected[goal])
+
+    def test_csr_and_float_weights(self):
+        graph = [[(1, 0.5), (2, 2.5)], [(2, 0.25)], [(3, 0.0)], [], [(0, 1.0)]]
+        expected = algorithms.dijkstra(graph, 0)
+        self.assertEqual(delta_stepping.delta_stepping(graph, 0, delta=0.3), expected)
+        self.assertEqual(delta_stepping.delta_stepping(CSRGraph.from_adjacency(graph), 0), expected)
+
+    def test_worker_processes(self):
+        random.seed(20)
+        graph, start, goal, _ = data_generator.get_random_graph(80)
+        # Send every frontier to the pool so the workers are exercised on a small graph
+        with mock.patch.object(delta_stepping, 'PARALLEL_MIN_FRONTIER', 1):
+            result = delta_stepping.delta_stepping(graph, start, delta=5, processes=2)
+        self.assertEqual(result, algorithms.dijkstra(graph, start))
+
+    def test_rejects_negative_weights(self):
+        with self.assertRaises(ValueError):
+            delta_stepping.delta_stepping([[(1, -1)], []], 0)
+        with self.assertRaises(ValueError):
+            delta_stepping.delta_stepping([[(1, 1)], []], 0, delta=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import random
+import unittest
+from data import data_generator
+from shortest_path import algorithms
+from shortest_path.dynamic import DynamicAllPairs, DynamicSingleSource
+
+INF = float('inf')
+
+
+def random_updates(graph, count, low=1, high=100):
+    n = len(graph)
+    for _ in range(count):
+        # No self-loops: floyd_warshall, the reference here, lets them overwrite the diagonal
+        u, v = random.sample(range(n), 2)
+        choice = random.random()
+        if choice < 0.15:
+            yield u, v, INF
+        else:
+            yield u, v, random.randint(low, high)
+
+
+class TestDynamic(unittest.TestCase):
+    def test_all_pairs_matches_recomputation(self):
+        random.seed(21)
+        graph = data_generator.get_random_graph(25)[0]
+        dynamic = DynamicAllPairs(graph)
+        for u, v, weight in random_updates(graph, 200):
+            dynamic.update_edge(u, v, weight)
+            self.assertEqual(dynamic.matrix, algorithms.floyd_warshall(dynamic))
+
+    def test_all_pairs_negative_weights(self):
+        dynamic = DynamicAllPairs([[(1, 4)], [(2, -2)], []])
+        dynamic.update_edge(0, 2, -1)
+        self.assertEqual(dynamic.distance(0, 2), -1)
+        dynamic.remove_edge(0, 2)
+        dynamic.update_edge(1, 2, 3)
+        self.assertEqual(dynamic.matrix, [[0, 4, 7], [INF, 0, 3], [INF, INF, 0]])
+        with self.assertRaises(ValueError):
+            dynamic.update_edge(2, 0, -8)
+
+    def test_single_source_matches_dijkstra(self):
+        random.seed(22)
+        graph, start, goal, _ = data_generator.get_random_graph(60)
+        dynamic = DynamicSingleSource(graph, start)
+        for u, v, weight in random_updates(graph, 300):
+            dynamic.update_edge(u, v, weight)
+            self.assertEqual(dynamic.distances, algorithms.dijkstra(dynamic, start))
+
+        path = dynamic.path(goal)
+        if path is not None:
+            self.assertEqual(sum(dynamic.weight(a, b) for a, b in zip(path, path[1:])), dynamic.distance(goal))
+
+    def test_single_source_subtree_repair(self):
+        graph = [[(1, 1), (3, 5)], [(2, 1)], [(4, 1)], [(4, 1)], []]
+        dynamic = DynamicSingleSource(graph, 0)
+        self.assertEqual(dynamic.path(4), [0, 1, 2, 4])
+        dynamic.remove_edge(1, 2)
+        self.assertEqual(dynamic.distances, [0, 1, INF, 5, 6])
+        self.assertEqual(dynamic.path(4), [0, 3, 4])
+        with self.assertRaises(ValueError):
+            dynamic.update_edge(0, 4, -1)
+
+
+if __name__ == '__main__':
+    unittest.main()
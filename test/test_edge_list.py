@@ -0,0 +1,66 @@
+import random
+import unittest
+from data import data_generator
+from shortest_path import algorithms
+from shortest_path.edge_list import EdgeList, EdgeListBatch, batched_bellman_ford
+from shortest_path.graph import CSRGraph
+
+
+class TestEdgeList(unittest.TestCase):
+    def setUp(self):
+        random.seed(23)
+        self.samples = []
+        for size in (1, 5, 20, 35):
+            graph, start, goal, _ = data_generator.get_random_graph(size)
+            # Some negative edges, which also create negative cycles in a few samples
+            graph = [[(v, w - 30 if random.random() < 0.1 else w) for v, w in edges] for edges in graph]
+            self.samples.append((graph, start, goal))
+
+    def test_matches_bellman_ford(self):
+        for graph, start, goal in self.samples:
+            for source in (graph, CSRGraph.from_adjacency(graph)):
+                edges = EdgeList.from_graph(source)
+                self.assertEqual(edges.bellman_ford(start), algorithms.bellman_ford(graph, start))
+                self.assertEqual(edges.bellman_ford(start, goal), algorithms.bellman_ford(graph, start, goal))
+
+    def test_reused_across_sources(self):
+        cycle = [[(1, 1)], [(2, -1)], [(0, -1)], []]
+        for graph in [graph for graph, _, _ in self.samples] + [cycle]:
+            edges = EdgeList.from_graph(graph)
+            self.assertIs(EdgeList.from_graph(edges), edges)
+            for start in range(len(graph)):
+                expected = algorithms.bellman_ford(graph, start)
+                result = edges.bellman_ford(start)
+                self.assertEqual(result, expected)
+                if isinstance(expected, algorithms.NegativeCycle):
+                    self.assertEqual(result.nodes, expected.nodes)
+        self.assertIsInstance(EdgeList.from_graph(cycle).bellman_ford(0), algorithms.NegativeCycle)
+        self.assertEqual(EdgeList.from_graph(cycle).bellman_ford(3), [float('inf')] * 3 + [0])
+
+    def test_batched(self):
+        # Includes a negative cycle and a single node with a negative self-loop
+        graphs = [graph for graph, _, _ in self.samples] + [[[(1, 1)], [(2, -1)], [(0, -1)]], [[(0, -1)]]]
+        starts = [start for _, start, _ in self.samples] + [0, 0]
+        for source in (graphs, EdgeListBatch(graphs)):
+            results = batched_bellman_ford(source, starts)
+            for graph, start, result in zip(graphs, starts, results):
+                expected = algorithms.bellman_ford(graph, start)
+                self.assertEqual(result, expected)
+                if isinstance(expected, algorithms.NegativeCycle):
+                    self.assertEqual(result.nodes, expected.nodes)
+            self.assertIsInstance(results[-1], algorithms.NegativeCycle)
+
+        # One batch answers other start nodes without converting again
+        batch = EdgeListBatch([graph for graph, _, _ in self.samples])
+        goals = [goal for _, _, goal in self.samples]
+        starts = [start for _, start, _ in self.samples]
+        self.assertEqual(batched_bellman_ford(batch, goals, starts),
+                         [algorithms.bellman_ford(graph, goal, start) for graph, start, goal in self.samples])
+
+    def test_rejects_mismatched_arrays(self):
+        with self.assertRaises(ValueError):
+            EdgeList(2, [0], [1, 0], [1])
+
+
+if __name__ == '__main__':
+    unittest.main()
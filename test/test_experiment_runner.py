@@ -0,0 +1,76 @@
+import math
+import os
+import tempfile
+import unittest
+from data import experiment_runner
+
+
+class TestExperimentRunner(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'cells.jsonl')
+        self.log = []
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_cells_are_deterministic(self):
+        cell = ("single_source", "dijkstra", 12, 1)
+        first, second = experiment_runner.run_cell(cell), experiment_runner.run_cell(cell)
+        self.assertEqual((first["size"], first["sample"]), (12, 1))
+        self.assertEqual(first["memory"], second["memory"])
+
+    def test_resumes_from_cache(self):
+        cache = experiment_runner.run_grid("single_source", [5, 10], 2, processes=2,
+                                           cache_path=self.path, log=self.log.append)
+        self.assertEqual(len(cache), 3 * 2 * 2)
+        with open(self.path) as f:
+            self.assertEqual(len(f.readlines()), 12)
+
+        # Extending the sweep only runs the new size
+        cache = experiment_runner.run_grid("single_source", [5, 10, 15], 2, processes=2,
+                                           cache_path=self.path, log=self.log.append)
+        self.assertEqual(len(cache), 18)
+        with open(self.path) as f:
+            self.assertEqual(len(f.readlines()), 18)
+
+        rows = experiment_runner.tables(cache, "single_source", [5, 10, 15])
+        self.assertEqual([row[0] for row in rows], [5, 10, 15])
+        self.assertTrue(all(len(row) == 7 and not any(map(math.isnan, row)) for row in rows))
+
+    def test_time_budget_skips_slow_cells(self):
+        # A cached slow measurement makes every larger size of that algorithm hopeless
+        slow = {"experiment": "all_pairs", "algorithm": "bellman_ford", "size": 5, "sample": 0,
+                "time": 100.0, "memory": 0}
+        with open(self.path, 'w') as f:
+            f.write('{"experiment": "all_pairs", "algorithm": "bellman_ford", "size": 5, "sample": 0, '
+                    '"time": 100.0, "memory": 0}\n{"truncated')
+
+        cache = experiment_runner.run_grid("all_pairs", [5, 10], 1, processes=1, cache_path=self.path,
+                                           time_budget=10, log=self.log.append)
+        self.assertEqual(cache["all_pairs|bellman_ford|5|0"], slow)
+        self.assertNotIn("all_pairs|bellman_ford|10|0", cache)
+        self.assertIn("all_pairs|dijkstra|10|0", cache)
+        self.assertTrue(any("bellman_ford" in line for line in self.log))
+
+        rows = experiment_runner.tables(cache, "all_pairs", [5, 10])
+        self.assertTrue(math.isnan(rows[1][3]) and math.isnan(rows[1][6]))
+
+    def test_tables_check_that_algorithms_agree(self):
+        cache = experiment_runner.run_grid("all_pairs", [6], 2, processes=1, log=self.log.append)
+        self.assertEqual(len({r["result"] for r in cache.values() if r["sample"] == 0}), 1)
+        experiment_runner.tables(cache, "all_pairs", [6])
+
+        cache["all_pairs|dijkstra|6|1"] = dict(cache["all_pairs|dijkstra|6|1"], result="0" * 64)
+        with self.assertRaisesRegex(AssertionError, "Discrepancy in distances"):
+            experiment_runner.tables(cache, "all_pairs", [6])
+
+    def test_predict_time(self):
+        cache = {str(i): {"experiment": "e", "algorithm": "a", "size": size, "sample": 0, "time": t}
+                 for i, (size, t) in enumerate([(10, 1.0), (20, 8.0)])}
+        self.assertAlmostEqual(experiment_runner.predict_time(cache, "e", "a", 40), 64.0)
+        self.assertEqual(experiment_runner.predict_time(cache, "e", "a", 10), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
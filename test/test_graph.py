@@ -0,0 +1,58 @@
+import random
+import unittest
+from array import array
+from data import data_generator
+from shortest_path import algorithms
+from shortest_path.graph import CSRGraph, index_typecode
+
+
+class TestCSRGraph(unittest.TestCase):
+    def setUp(self):
+        self.adjacency = [
+            [(1, 4), (2, -1)],
+            [(2, -2)],
+            []
+        ]
+        self.graph = CSRGraph.from_adjacency(self.adjacency)
+
+    def test_from_adjacency_layout(self):
+        # Edges are stored contiguously, grouped by their source node
+        self.assertEqual(list(self.graph.offsets), [0, 2, 3, 3])
+        self.assertEqual(list(self.graph.targets), [1, 2, 2])
+        self.assertEqual(list(self.graph.weights), [4, -1, -2])
+        self.assertEqual(len(self.graph), 3)
+        self.assertEqual(self.graph.edge_count, 3)
+
+    def test_round_trip(self):
+        self.assertEqual(self.graph.to_adjacency(), self.adjacency)
+        self.assertEqual(list(self.graph.edges()), [(0, 1, 4), (0, 2, -1), (1, 2, -2)])
+
+    def test_typecodes(self):
+        self.assertIsInstance(self.graph.offsets, array)
+        self.assertEqual(self.graph.weights.typecode, 'q')
+        self.assertEqual(CSRGraph.from_adjacency([[(0, 0.5)]]).weights.typecode, 'd')
+        self.assertEqual(index_typecode(100), 'b')
+        self.assertEqual(index_typecode(1000), 'h')
+
+    def test_invalid_buffers(self):
+        with self.assertRaises(ValueError):
+            CSRGraph(array('q', [0, 2]), array('i', [1]), array('q', [1]))
+
+    def test_algorithms_accept_csr(self):
+        # Every algorithm gives the same answer for both representations
+        self.assertEqual(algorithms.bellman_ford(self.graph, 0, 2), -1)
+        self.assertEqual(algorithms.floyd_warshall(self.graph, 0, 2), -1)
+
+        random.seed(7)
+        for _ in range(5):
+            graph, start, goal, _ = data_generator.get_random_graph(30)
+            csr = CSRGraph.from_adjacency(graph)
+            self.assertEqual(algorithms.dijkstra(csr, start), algorithms.dijkstra(graph, start))
+            self.assertEqual(algorithms.dijkstra(csr, start, goal), algorithms.dijkstra(graph, start, goal))
+            self.assertEqual(algorithms.bellman_ford(csr, start), algorithms.bellman_ford(graph, start))
+            self.assertEqual(algorithms.floyd_warshall(csr), algorithms.floyd_warshall(graph))
+            self.assertTrue(data_generator.has_path(csr, start, goal))
+
+
+if __name__ == '__main__':
+    unittest.main()
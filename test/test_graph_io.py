@@ -0,0 +1,56 @@
+import os
+import random
+import tempfile
+import unittest
+from data import data_generator
+from shortest_path import algorithms
+from shortest_path.graph import CSRGraph
+from shortest_path.graph_io import convert_edge_list, load_graph, read_edge_list, save_graph
+
+
+class TestGraphFiles(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'graph.spg')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_round_trip(self):
+        random.seed(61)
+        graph, start, goal, _ = data_generator.get_random_graph(40)
+        save_graph(graph, self.path)
+        loaded = load_graph(self.path)
+
+        self.assertEqual(loaded.to_adjacency(), graph)
+        self.assertIsInstance(loaded.targets, memoryview)
+        self.assertTrue(loaded.targets.readonly)
+        self.assertEqual(algorithms.dijkstra(loaded, start), algorithms.dijkstra(graph, start))
+        self.assertEqual(algorithms.bellman_ford(loaded, start, goal), algorithms.bellman_ford(graph, start, goal))
+
+    def test_float_weights_and_empty_graph(self):
+        for graph in ([[(1, 0.5)], [(0, -2.25)], []], [], [[], []]):
+            save_graph(CSRGraph.from_adjacency(graph), self.path)
+            self.assertEqual(load_graph(self.path).to_adjacency(), graph)
+
+    def test_rejects_other_files(self):
+        with open(self.path, 'wb') as f:
+            f.write(b'not a graph file'.ljust(64, b'\0'))
+        with self.assertRaises(ValueError):
+            load_graph(self.path)
+
+    def test_edge_list(self):
+        text_path = os.path.join(self.directory.name, 'edges.txt')
+        with open(text_path, 'w') as f:
+            f.write("# source target weight\n2 0 7\n0 1 4\n\n0 2 -1  # negative\n1 2 -2\n")
+
+        graph = read_edge_list(text_path)
+        self.assertEqual(graph.to_adjacency(), [[(1, 4), (2, -1)], [(2, -2)], [(0, 7)]])
+        self.assertEqual(len(read_edge_list(text_path, n=5)), 5)
+
+        convert_edge_list(text_path, self.path)
+        self.assertEqual(algorithms.bellman_ford(load_graph(self.path), 0, 2), -1)
+
+
+if __name__ == '__main__':
+    unittest.main()
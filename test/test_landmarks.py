@@ -0,0 +1,54 @@
+import os
+import random
+import tempfile
+import unittest
+from data import data_generator
+from shortest_path import algorithms
+from shortest_path.graph import CSRGraph
+from shortest_path.landmarks import LandmarkIndex
+
+
+class TestLandmarkIndex(unittest.TestCase):
+    def setUp(self):
+        random.seed(9)
+        self.graph = data_generator.get_random_graph(60)[0]
+        self.index = LandmarkIndex.build(self.graph, count=4, seed=1)
+
+    def test_build(self):
+        self.assertEqual(len(self.index.landmarks), 4)
+        self.assertEqual(len(set(self.index.landmarks)), 4)
+        landmark = self.index.landmarks[0]
+        self.assertEqual(list(self.index.forward[0]), algorithms.dijkstra(self.graph, landmark))
+
+    def test_query_matches_dijkstra(self):
+        csr = CSRGraph.from_adjacency(self.graph)
+        for start in range(0, 60, 7):
+            for end in range(60):
+                distance, settled = self.index.query(csr, start, end)
+                self.assertEqual(distance, algorithms.dijkstra(self.graph, start, end))
+                self.assertLessEqual(settled, len(self.graph))
+
+    def test_lower_bound_is_admissible(self):
+        for start in range(0, 60, 11):
+            distances = algorithms.dijkstra(self.graph, start)
+            for end in range(60):
+                self.assertLessEqual(self.index.lower_bound(start, end), distances[end])
+
+    def test_unreachable_target(self):
+        graph = [[(1, 2)], [], [(0, 1)]]
+        index = LandmarkIndex.build(graph, count=2, seed=0)
+        self.assertEqual(index.query(graph, 0, 2)[0], float('inf'))
+        self.assertEqual(index.query(graph, 2, 1), (3, 3))
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'index.alt')
+            self.index.save(path)
+            loaded = LandmarkIndex.load(path)
+        self.assertEqual(loaded.landmarks, self.index.landmarks)
+        self.assertEqual(loaded.forward, self.index.forward)
+        self.assertEqual(loaded.backward, self.index.backward)
+
+
+if __name__ == '__main__':
+    unittest.main()
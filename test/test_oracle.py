@@ -0,0 +1,42 @@
+import unittest
+from data import data_generator
+from shortest_path import algorithms
+from shortest_path.oracle import DistanceOracle, symmetrize
+
+
+class TestDistanceOracle(unittest.TestCase):
+    def setUp(self):
+        self.graph = data_generator.get_large_random_graph(300, seed=25)[0]
+        self.undirected = symmetrize(self.graph)
+
+    def test_stretch_bound(self):
+        exact = [algorithms.dijkstra(self.undirected, u, queue='heap') for u in range(0, 300, 15)]
+        for k in (1, 2, 3):
+            oracle = DistanceOracle.build(self.graph, k=k, seed=k)
+            self.assertEqual(oracle.stretch, 2 * k - 1)
+            for u, row in zip(range(0, 300, 15), exact):
+                for v in range(0, 300, 7):
+                    estimate = oracle.query(u, v)
+                    self.assertGreaterEqual(estimate, row[v])
+                    self.assertLessEqual(estimate, oracle.stretch * row[v])
+                    if k == 1:
+                        self.assertEqual(estimate, row[v])
+
+    def test_index_is_smaller_than_matrix(self):
+        oracle = DistanceOracle.build(self.graph, k=3, seed=0)
+        self.assertLess(oracle.size, 300 * 300 // 4)
+
+    def test_symmetrize_and_components(self):
+        graph = [[(1, 5), (2, 1)], [(0, 2)], [], [(4, 0.5)], []]
+        self.assertEqual(symmetrize(graph).to_adjacency(), [[(1, 2), (2, 1)], [(0, 2)], [(0, 1)], [(4, 0.5)], [(3, 0.5)]])
+
+        oracle = DistanceOracle.build(graph, k=2, seed=1)
+        self.assertEqual(oracle.query(2, 1), 3)
+        self.assertEqual(oracle.query(4, 3), 0.5)
+        self.assertEqual(oracle.query(0, 4), float('inf'))
+        with self.assertRaises(ValueError):
+            DistanceOracle.build([[(1, -1)], []])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+from data import data_generator
+from shortest_path import algorithms, out_of_core
+
+
+class TestOutOfCore(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'dist.bin')
+        random.seed(20)
+        self.graph = data_generator.get_random_graph(23)[0]
+        # Room for 5x5 tiles, so the 23 nodes span several k-blocks
+        self.max_memory = out_of_core.CELL_BYTES * out_of_core.TILES_IN_MEMORY * 25
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_matches_floyd_warshall(self):
+        self.assertEqual(out_of_core.block_size_for(self.max_memory), 5)
+        with out_of_core.out_of_core_floyd_warshall(self.graph, self.path, self.max_memory) as matrix:
+            expected = algorithms.floyd_warshall(self.graph)
+            self.assertTrue(matrix.complete)
+            self.assertEqual(list(matrix.rows()), expected)
+            self.assertEqual(matrix[3, 7], expected[3][7])
+            self.assertEqual(os.path.getsize(self.path), 23 * 23 * 8)
+
+    def test_resumes_after_crash(self):
+        real = out_of_core._write_progress
+
+        def crash_after_second_block(path, progress):
+            real(path, progress)
+            if progress['next_block'] == 2:
+                raise KeyboardInterrupt
+
+        with mock.patch.object(out_of_core, '_write_progress', crash_after_second_block):
+            with self.assertRaises(KeyboardInterrupt):
+                out_of_core.out_of_core_floyd_warshall(self.graph, self.path, self.max_memory)
+        with out_of_core.DiskDistanceMatrix(self.path) as partial:
+            self.assertFalse(partial.complete)
+
+        starts = []
+        real_blocked = out_of_core._floyd_warshall_blocked
+
+        def spy(dist, n, block_size, first_block, on_block_done):
+            starts.append(first_block)
+            real_blocked(dist, n, block_size, first_block, on_block_done)
+
+        with mock.patch.object(out_of_core, '_floyd_warshall_blocked', spy):
+            # A different memory limit does not change the block grid of a resumed run
+            matrix = out_of_core.out_of_core_floyd_warshall(self.graph, self.path, 10 ** 9)
+        self.assertEqual(starts, [2])
+        self.assertEqual(list(matrix.rows()), algorithms.floyd_warshall(self.graph))
+        matrix.close()
+
+    def test_other_graph_of_same_size_starts_over(self):
+        with out_of_core.out_of_core_floyd_warshall([[(1, 5)], [(2, 5)], []], self.path) as matrix:
+            self.assertEqual(matrix[0, 2], 10)
+        with out_of_core.out_of_core_floyd_warshall([[(1, 1)], [(2, 1)], []], self.path) as matrix:
+            self.assertEqual(matrix[0, 2], 2)
+
+    def test_empty_and_float_graphs(self):
+        with out_of_core.out_of_core_floyd_warshall([], self.path) as matrix:
+            self.assertEqual(list(matrix.rows()), [])
+        graph = [[(1, 0.5)], [(2, 0.25)], []]
+        with out_of_core.out_of_core_floyd_warshall(graph, self.path, resume=False) as matrix:
+            self.assertEqual(list(matrix.rows()), algorithms.floyd_warshall(graph))
+
+
+if __name__ == '__main__':
+    unittest.main()
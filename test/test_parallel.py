@@ -0,0 +1,46 @@
+import random
+import unittest
+from data import data_generator
+from shortest_path import algorithms
+from shortest_path.graph import CSRGraph
+from shortest_path.parallel import DistanceMatrix, SharedCSR, parallel_all_pairs
+
+
+class TestParallelAllPairs(unittest.TestCase):
+    def setUp(self):
+        random.seed(21)
+        self.graph = data_generator.get_random_graph(40)[0]
+        self.expected = [algorithms.dijkstra(self.graph, s) for s in range(len(self.graph))]
+
+    def test_shared_matrix(self):
+        result = parallel_all_pairs(self.graph, processes=2, chunk_size=7)
+        self.assertIsInstance(result, DistanceMatrix)
+        self.assertEqual(list(result.rows()), self.expected)
+        self.assertEqual(result[3, 5], self.expected[3][5])
+        self.assertEqual(result.values.typecode, 'd')
+
+    def test_stream_rows(self):
+        rows = parallel_all_pairs(CSRGraph.from_adjacency(self.graph), processes=2, stream=True)
+        self.assertEqual(list(rows), self.expected)
+
+    def test_empty_graph(self):
+        self.assertEqual(list(parallel_all_pairs([], processes=2).rows()), [])
+        self.assertEqual(list(parallel_all_pairs([[]], processes=2).rows()), [[0]])
+
+    def test_shared_csr_round_trip(self):
+        # Attaching to the shared blocks gives back the same graph without copying
+        csr = CSRGraph.from_adjacency(self.graph)
+        shared = SharedCSR(csr)
+        try:
+            attached, blocks = SharedCSR.attach(shared.descriptor)
+            self.assertEqual(attached.to_adjacency(), self.graph)
+            for view in (attached.offsets, attached.targets, attached.weights):
+                view.release()
+            for block in blocks:
+                block.close()
+        finally:
+            shared.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import random
+import unittest
+from data import data_generator
+from shortest_path import algorithms
+from shortest_path.graph import CSRGraph
+from shortest_path.paths import NextHopMatrix, predecessor_path
+
+
+class TestPathReconstruction(unittest.TestCase):
+    def path_length(self, graph, path):
+        weights = {(u, v): w for u in range(len(graph)) for v, w in graph[u]}
+        return sum(weights[(u, v)] for u, v in zip(path, path[1:]))
+
+    def test_predecessor_paths(self):
+        random.seed(43)
+        for _ in range(5):
+            graph, start, goal, _ = data_generator.get_random_graph(30)
+            dag = [[(v, w - 50) for v, w in edges if v > u] for u, edges in enumerate(graph)]
+            runs = [
+                (graph, algorithms.dijkstra(graph, start, predecessors=True)),
+                (graph, algorithms.dijkstra(CSRGraph.from_adjacency(graph), start, queue='dial', predecessors=True)),
+                (graph, algorithms.dijkstra(graph, start, queue='radix', predecessors=True)),
+                (dag, algorithms.bellman_ford(dag, start, predecessors=True)),
+            ]
+            for g, (distances, predecessors) in runs:
+                for end in range(len(g)):
+                    path = predecessor_path(predecessors, start, end)
+                    if distances[end] == float('inf'):
+                        self.assertIsNone(path)
+                    else:
+                        self.assertEqual((path[0], path[-1]), (start, end))
+                        self.assertEqual(self.path_length(g, path), distances[end])
+
+    def test_compact_predecessor_type(self):
+        _, predecessors = algorithms.dijkstra([[(1, 1)], []], 0, predecessors=True)
+        self.assertEqual(predecessors.typecode, 'b')
+        self.assertEqual(list(predecessors), [-1, 0])
+        distance, predecessors = algorithms.dijkstra([[(1, 1)], []], 0, 1, predecessors=True)
+        self.assertEqual(distance, 1)
+
+    def test_next_hop_matrix(self):
+        random.seed(47)
+        graph = data_generator.get_random_graph(25)[0]
+        graph = [[(v, w - 30) for v, w in edges if v > u] for u, edges in enumerate(graph)]
+        dist, next_hops = algorithms.floyd_warshall(graph, next_hop=True)
+        self.assertEqual(dist, algorithms.floyd_warshall(graph))
+        self.assertIsInstance(next_hops, NextHopMatrix)
+        for i in range(25):
+            for j in range(25):
+                path = next_hops.path(i, j)
+                if dist[i][j] == float('inf'):
+                    self.assertIsNone(path)
+                else:
+                    self.assertEqual((path[0], path[-1]), (i, j))
+                    self.assertEqual(self.path_length(graph, path), dist[i][j])
+
+    def test_next_hop_single_pair(self):
+        distance, next_hops = algorithms.floyd_warshall([[(1, 4), (2, -1)], [(2, -2)], []], 0, 2, next_hop=True)
+        self.assertEqual(distance, -1)
+        self.assertEqual(next_hops.path(0, 2), [0, 2])
+        self.assertEqual(next_hops[0, 1], 1)
+        self.assertEqual(next_hops[2, 0], -1)
+
+
+if __name__ == '__main__':
+    unittest.main()
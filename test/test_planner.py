@@ -0,0 +1,76 @@
+import random
+import unittest
+from unittest import mock
+from data import data_generator
+from shortest_path import algorithms, planner
+from shortest_path.graph import CSRGraph
+
+
+class TestPlanner(unittest.TestCase):
+    def setUp(self):
+        random.seed(24)
+        self.graph, self.start, self.goal, _ = data_generator.get_random_graph(30)
+        self.negative = [[(1, 4), (2, -1)], [(2, -2)], [(0, 3)]]
+        self.cycle = [[(1, 1)], [(2, -1)], [(0, -1)]]
+
+    def test_query_shapes(self):
+        matrix = algorithms.floyd_warshall(self.graph)
+        self.assertEqual(planner.shortest_path(self.graph, self.start, self.goal), matrix[self.start][self.goal])
+        self.assertEqual(planner.shortest_path(self.graph, self.start), matrix[self.start])
+        self.assertEqual(planner.shortest_path(self.graph, self.start, [3, 1]),
+                         [matrix[self.start][3], matrix[self.start][1]])
+        self.assertEqual(planner.shortest_path(self.graph, iter([2, 5]), 7), [matrix[2][7], matrix[5][7]])
+        self.assertEqual(planner.shortest_path(self.graph, [4], [0, 9]), [[matrix[4][0], matrix[4][9]]])
+        self.assertEqual(planner.shortest_path(self.graph), matrix)
+        self.assertEqual(planner.shortest_path(CSRGraph.from_adjacency(self.graph)), matrix)
+
+    def test_negative_weights(self):
+        matrix = algorithms.floyd_warshall(self.negative)
+        self.assertEqual(planner.plan(self.negative, 0, 2).engine, 'spfa')
+        self.assertEqual(planner.shortest_path(self.negative, 0, 2), -1)
+        self.assertEqual(planner.shortest_path(self.negative, [0], None), [matrix[0]])
+        self.assertEqual(planner.shortest_path(self.negative), matrix)
+        self.assertEqual(planner.shortest_path(self.cycle, 0, 2), "Negative cycle detected")
+        self.assertEqual(planner.shortest_path(self.cycle), "Negative cycle detected")
+
+    def test_engine_choices(self):
+        self.assertEqual(planner.plan(self.graph, self.start, self.goal).engine, 'bidirectional_dijkstra')
+        self.assertEqual(planner.plan(self.graph).engine, 'many_to_many')
+        self.assertEqual(planner.plan(self.negative).engine, 'johnson')
+
+        # With a cheaper matrix kernel the n^3 engine wins on a complete graph
+        complete = [[(j, 1) for j in range(4) if j != i] for i in range(4)]
+        self.assertIn('blocked_floyd_warshall', planner.plan(complete).estimates)
+        with mock.patch.object(planner, 'FLOYD_WARSHALL_UNIT', 1e-10):
+            self.assertEqual(planner.plan(complete).engine, 'blocked_floyd_warshall')
+            self.assertEqual(planner.shortest_path(complete), algorithms.floyd_warshall(complete))
+            self.assertEqual(planner.plan(self.cycle).engine, 'blocked_floyd_warshall')
+            self.assertEqual(planner.shortest_path(self.cycle), "Negative cycle detected")
+
+    def test_explain_and_cached_stats(self):
+        text = planner.explain(self.negative)
+        self.assertIn('-> johnson', text)
+        self.assertIn('negative weights', text)
+        self.assertIs(planner.graph_stats(self.graph), planner.graph_stats(self.graph))
+        stats = planner.graph_stats(self.graph)
+        self.assertFalse(stats.negative)
+        self.assertTrue(stats.integral)
+        self.assertEqual(stats.edges, sum(len(edges) for edges in self.graph))
+
+        csr = CSRGraph.from_adjacency([[(1, 2)], [(0, 3)]])
+        self.assertIn('bucket queue', planner.explain(csr, 0))
+
+    def test_pair_queries_reuse_the_reverse(self):
+        graph = [[(1, 5)], [(2, 5)], []]
+        self.assertEqual(planner.shortest_path(graph, 0, 2), 10)
+        with mock.patch.object(planner, 'reverse_adjacency') as reverse_adjacency:
+            self.assertEqual(planner.shortest_path(graph, 0, 2), 10)
+            reverse_adjacency.assert_not_called()
+
+        graph[0].append((2, 1))
+        planner.graph_stats(graph, refresh=True)
+        self.assertEqual(planner.shortest_path(graph, 0, 2), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
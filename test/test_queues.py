@@ -0,0 +1,61 @@
+import random
+import unittest
+from data import data_generator
+from shortest_path import algorithms, queues
+from shortest_path.graph import CSRGraph
+
+
+class TestBucketQueues(unittest.TestCase):
+    def setUp(self):
+        self.graph = [
+            [(1, 3), (2, 1), (3, 10)],
+            [(4, 2)],
+            [(4, 4)],
+            [(4, 1)],
+            []
+        ]
+
+    def test_radix_heap_pops_in_order(self):
+        random.seed(31)
+        heap = queues.RadixHeap()
+        popped = []
+        last = 0
+        # Interleave pushes and pops, never pushing below the last popped key
+        for _ in range(500):
+            if heap and random.random() < 0.4:
+                last = heap.pop()[0]
+                popped.append(last)
+            else:
+                heap.push(last + random.randint(0, 1000), None)
+        while heap:
+            popped.append(heap.pop()[0])
+        self.assertEqual(popped, sorted(popped))
+
+    def test_backends_match_heap(self):
+        random.seed(37)
+        for limit in (1, 10, 100000):
+            graph, start, goal, _ = data_generator.get_random_graph(40, limit=limit)
+            csr = CSRGraph.from_adjacency(graph)
+            expected = algorithms.dijkstra(graph, start, queue='heap')
+            for backend in ('dial', 'radix'):
+                for g in (graph, csr):
+                    self.assertEqual(algorithms.dijkstra(g, start, queue=backend), expected)
+                    self.assertEqual(algorithms.dijkstra(g, start, goal, queue=backend), expected[goal])
+
+    def test_zero_weights_and_unreachable(self):
+        graph = [[(1, 0)], [(2, 0)], [], [(0, 1)]]
+        for backend in ('heap', 'dial', 'radix'):
+            self.assertEqual(algorithms.dijkstra(graph, 0, queue=backend), [0, 0, 0, float('inf')])
+            self.assertEqual(algorithms.dijkstra(graph, 0, 3, queue=backend), float('inf'))
+
+    def test_automatic_choice(self):
+        self.assertEqual(queues.choose_queue(self.graph), 'heap')
+        self.assertEqual(queues.choose_queue(CSRGraph.from_adjacency(self.graph)), 'dial')
+        self.assertEqual(queues.choose_queue(CSRGraph.from_adjacency([[(0, 10 ** 6)]])), 'radix')
+        self.assertEqual(queues.choose_queue(CSRGraph.from_adjacency([[(0, 1.5)]])), 'heap')
+        self.assertEqual(queues.choose_queue(CSRGraph.from_adjacency([[(0, -1)]])), 'heap')
+        self.assertEqual(algorithms.dijkstra(CSRGraph.from_adjacency(self.graph), 0, 4), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import random
+import unittest
+from data import data_generator
+from shortest_path import algorithms
+from shortest_path.bidirectional import bidirectional_dijkstra
+from shortest_path.graph import CSRGraph
+from shortest_path.reachability import ReachabilityIndex, strongly_connected_components
+
+
+class TestReachabilityIndex(unittest.TestCase):
+    def setUp(self):
+        # Two cycles {0, 1} and {2, 3} joined by 1 -> 2, plus an isolated node 4
+        self.graph = [[(1, 1)], [(0, 1), (2, 1)], [(3, 1)], [(2, 1)], []]
+
+    def test_components(self):
+        components, count = strongly_connected_components(self.graph)
+        self.assertEqual(count, 3)
+        self.assertEqual(components[0], components[1])
+        self.assertEqual(components[2], components[3])
+        # Reverse topological numbering: {2, 3} is finished before {0, 1}
+        self.assertGreater(components[0], components[2])
+
+    def test_reachable(self):
+        for closure_limit in (0, 100):
+            index = ReachabilityIndex.build(self.graph, closure_limit=closure_limit)
+            self.assertTrue(index.reachable(0, 3))
+            self.assertTrue(index.reachable(1, 0))
+            self.assertFalse(index.reachable(3, 0))
+            self.assertFalse(index.reachable(0, 4))
+            self.assertTrue(index.reachable(4, 4))
+
+    def test_matches_bfs_on_random_graphs(self):
+        random.seed(59)
+        for _ in range(5):
+            graph = data_generator.get_random_graph(30)[0]
+            # Sparsify so that many pairs become unreachable
+            graph = [edges[:1] for edges in graph]
+            for closure_limit in (0, 100):
+                index = ReachabilityIndex.build(CSRGraph.from_adjacency(graph), closure_limit=closure_limit)
+                for u in range(30):
+                    for v in range(30):
+                        self.assertEqual(index.reachable(u, v), data_generator.has_path(graph, u, v))
+
+    def test_searches_short_circuit(self):
+        index = ReachabilityIndex.build(self.graph)
+        inf = float('inf')
+        self.assertEqual(algorithms.dijkstra(self.graph, 3, 0, reachability=index), inf)
+        self.assertEqual(algorithms.dijkstra(self.graph, 0, 3, reachability=index), 3)
+        self.assertEqual(algorithms.spfa(self.graph, 3, 0, reachability=index), inf)
+        self.assertEqual(bidirectional_dijkstra(self.graph, 3, 0, reachability=index), inf)
+        self.assertEqual(algorithms.dijkstra(self.graph, 3, 0, predecessors=True, reachability=index)[0], inf)
+        self.assertFalse(data_generator.has_path(self.graph, 3, 0, reachability=index))
+        self.assertTrue(data_generator.has_path(self.graph, 0, 3, reachability=index))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import asyncio
+import json
+import os
+import random
+import tempfile
+import unittest
+from data import data_generator
+from shortest_path import algorithms
+from shortest_path.graph_io import save_graph
+from shortest_path.service import ShortestPathService
+
+
+class TestService(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        random.seed(22)
+        self.graph, self.start, self.goal, _ = data_generator.get_random_graph(40)
+
+    async def test_coalescing_and_cache(self):
+        service = ShortestPathService(self.graph, workers=2, cache_size=3, threads=True)
+        try:
+            targets = [0, 1, 2, 3, 4, 5]
+            answers = await asyncio.gather(*(service.query(self.start, t) for t in targets))
+            expected = algorithms.dijkstra(self.graph, self.start)
+            self.assertEqual(answers, [expected[t] for t in targets])
+            # All six queries waited on one search
+            self.assertEqual(service.counters['searches'], 1)
+            self.assertEqual(service.counters['coalesced'], 5)
+            self.assertEqual(len(service.cache), 3)
+
+            await service.query(self.start, 5)
+            self.assertEqual(service.counters['hits'], 1)
+            distance, path = await service.query(self.start, self.goal, return_path=True)
+            self.assertEqual(distance, expected[self.goal])
+            self.assertEqual((path[0], path[-1]), (self.start, self.goal))
+
+            stats = service.stats()
+            self.assertAlmostEqual(stats['hit_rate'], 1 / 8)
+            self.assertGreaterEqual(stats['latency']['p99'], stats['latency']['p50'])
+
+            service.set_graph([[(1, -1)], [(2, -2)], []])
+            self.assertEqual(service.version, 2)
+            self.assertEqual(len(service.cache), 0)
+            self.assertEqual(await service.query(0, 2), -3)
+        finally:
+            service.close()
+
+    async def test_socket_protocol_with_processes(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'graph.spg')
+            save_graph(self.graph, path)
+            service = ShortestPathService(path, workers=1)
+            server = await service.serve(port=0)
+            port = server.sockets[0].getsockname()[1]
+            try:
+                reader, writer = await asyncio.open_connection('127.0.0.1', port)
+
+                async def ask(request):
+                    writer.write(json.dumps(request).encode() + b'\n')
+                    await writer.drain()
+                    return json.loads(await reader.readline())
+
+                expected = algorithms.dijkstra(self.graph, self.start, self.goal)
+                answer = await ask({'op': 'path', 'source': self.start, 'target': self.goal})
+                self.assertEqual(answer['distance'], expected)
+                self.assertEqual(answer['path'][-1], self.goal)
+                self.assertIn('error', await ask({'op': 'distance', 'source': 0, 'target': 99}))
+                self.assertIn('error', await ask({'op': 'shortest'}))
+                self.assertEqual((await ask({'op': 'stats'}))['misses'], 1)
+                self.assertEqual((await ask({'op': 'reload', 'graph': path}))['version'], 2)
+
+                writer.close()
+                await writer.wait_closed()
+                # The handler sees the end of the stream and returns before teardown
+                await asyncio.wait_for(service.wait_connections(), 5)
+            finally:
+                server.close()
+                await server.wait_closed()
+                await service.wait_connections()
+                service.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import random
+import unittest
+from data import data_generator
+from shortest_path import algorithms
+from shortest_path.graph import CSRGraph
+from shortest_path.solver import ShortestPathSolver
+
+
+class TestShortestPathSolver(unittest.TestCase):
+    def setUp(self):
+        self.graph = [
+            [(1, 3), (2, 1), (3, 10)],
+            [(4, 2)],
+            [(4, 4)],
+            [(4, 1)],
+            []
+        ]
+
+    def test_repeated_queries_match_dijkstra(self):
+        random.seed(41)
+        graph = data_generator.get_random_graph(50)[0]
+        solver = ShortestPathSolver(CSRGraph.from_adjacency(graph))
+        for _ in range(30):
+            start, end = random.randrange(50), random.randrange(50)
+            self.assertEqual(solver.dijkstra(start, end), algorithms.dijkstra(graph, start, end))
+            self.assertEqual(solver.dijkstra(start), algorithms.dijkstra(graph, start))
+            self.assertEqual(solver.bellman_ford(start), algorithms.bellman_ford(graph, start))
+
+    def test_only_touched_entries_are_reset(self):
+        solver = ShortestPathSolver(self.graph)
+        solver.dijkstra(0)
+        self.assertEqual(len(solver._touched), 5)
+        # Node 4 has no outgoing edges, so the next query touches a single entry
+        self.assertEqual(solver.dijkstra(4, 0), float('inf'))
+        self.assertEqual(solver._touched, [4])
+        self.assertEqual(solver.distances, [float('inf')] * 4 + [0])
+
+    def test_bellman_ford_negative_weights(self):
+        solver = ShortestPathSolver([[(1, 4), (2, -1)], [(2, -2)], []])
+        self.assertEqual(solver.bellman_ford(0, 2), -1)
+        self.assertEqual(solver.path(2), [0, 2])
+
+        solver = ShortestPathSolver([[(1, 1)], [(2, -1)], [(0, -1)]])
+        result = solver.bellman_ford(0)
+        self.assertEqual(result, "Negative cycle detected")
+        self.assertEqual(result.nodes, {0, 1, 2})
+
+    def test_path(self):
+        solver = ShortestPathSolver(self.graph)
+        solver.dijkstra(0)
+        self.assertEqual(solver.path(3), [0, 3])
+        self.assertIn(solver.path(4), ([0, 1, 4], [0, 2, 4]))
+        self.assertEqual(solver.path(0), [0])
+        solver.dijkstra(1)
+        self.assertIsNone(solver.path(0))
+
+
+if __name__ == '__main__':
+    unittest.main()
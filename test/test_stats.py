@@ -0,0 +1,76 @@
+import random
+import unittest
+from data import data_generator, execution_time_gathering
+from shortest_path import algorithms
+from shortest_path.graph import CSRGraph
+from shortest_path.stats import Stats
+
+
+class TestStats(unittest.TestCase):
+    def setUp(self):
+        self.graph = [
+            [(1, 3), (2, 1), (3, 10)],
+            [(4, 2)],
+            [(4, 4), (1, 1)],
+            [(4, 1)],
+            []
+        ]
+
+    def test_dijkstra_counters(self):
+        stats = Stats()
+        self.assertEqual(algorithms.dijkstra(self.graph, 0, stats=stats), algorithms.dijkstra(self.graph, 0))
+        # 1 is first reached through 0 (3) and improved through 2 (2), leaving one stale entry
+        self.assertEqual(stats.counters['relaxations'], 6)
+        self.assertEqual(stats.counters['heap_pushes'], 7)
+        self.assertEqual(stats.counters['heap_pops'], 7)
+        self.assertEqual(stats.counters['stale_pops'], 2)
+        self.assertIn('search', stats.timings)
+
+    def test_dijkstra_counters_on_csr(self):
+        # Integer weights would pick a bucket queue; with stats the counted heap runs
+        csr = CSRGraph.from_adjacency(self.graph)
+        stats = Stats()
+        self.assertEqual(algorithms.dijkstra(csr, 0, stats=stats), algorithms.dijkstra(self.graph, 0))
+        self.assertEqual(stats.counters['relaxations'], 6)
+        self.assertEqual(stats.counters['heap_pushes'], 7)
+        self.assertEqual(stats.counters['stale_pops'], 2)
+
+    def test_bellman_ford_counters(self):
+        stats = Stats()
+        self.assertEqual(algorithms.bellman_ford(self.graph, 0, 4, stats=stats), 4)
+        # The third pass changes nothing and ends the loop early
+        self.assertEqual(stats.counters['passes'], 3)
+        self.assertGreater(stats.counters['relaxations'], 0)
+        self.assertEqual(set(stats.timings), {'relax', 'cycle_check'})
+
+        cycle = [[(1, 1)], [(2, -1)], [(0, -1)]]
+        self.assertEqual(algorithms.bellman_ford(cycle, 0, stats=Stats()), "Negative cycle detected")
+
+    def test_floyd_warshall_series(self):
+        phases = []
+        stats = Stats(hook=lambda phase, seconds: phases.append(phase))
+        result, hops = algorithms.floyd_warshall(self.graph, next_hop=True, stats=stats)
+        expected, expected_hops = algorithms.floyd_warshall(self.graph, next_hop=True)
+        self.assertEqual(result, expected)
+        self.assertEqual(hops.path(0, 4), expected_hops.path(0, 4))
+        self.assertEqual(len(stats.series['cells_updated']), 5)
+        self.assertEqual(sum(stats.series['cells_updated']), stats.counters['cells_updated'])
+        self.assertEqual(phases, ['init', 'relax'])
+
+    def test_results_match_uninstrumented(self):
+        random.seed(5)
+        graph, start, goal, _ = data_generator.get_random_graph(30)
+        for function in (algorithms.dijkstra, algorithms.bellman_ford, algorithms.floyd_warshall):
+            self.assertEqual(function(graph, start, goal, stats=Stats()), function(graph, start, goal))
+
+    def test_experiment_reports_counters(self):
+        random.seed(3)
+        rows = execution_time_gathering.run_single_source_experiment(5, 10, 5, samples=3, counters=True)
+        self.assertEqual(len(rows[0]), 8)
+        self.assertEqual(set(rows[0][7]), {'dijkstra', 'bellman_ford', 'floyd_warshall'})
+        self.assertIn('stale_pops', rows[0][7]['dijkstra'])
+        self.assertIn('cells_updated', rows[0][7]['floyd_warshall'])
+
+
+if __name__ == '__main__':
+    unittest.main()